@@ -5,17 +5,276 @@ A GUI application that displays programming languages and generates Hello World
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, font
+from tkinter import scrolledtext, messagebox, font
 import sys
+import os
+import json
+import gc
+import pickle
+import string
+import html
+from functools import lru_cache
+from types import MappingProxyType
+
+# Language table shipped alongside this script
+LANGUAGES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "languages.json")
+# Pickled copy of the resolved tables, kept next to Python's own bytecode cache
+LANGUAGES_CACHE = os.path.join(os.path.dirname(LANGUAGES_FILE), "__pycache__", "languages.pickle")
+# Bump whenever the shape of the cached table changes
+_CACHE_FORMAT = 4
+
+def _resolve_templates(entries, templates):
+    """Replace {"template": name} references with the shared template string"""
+    for name, entry in entries.items():
+        if isinstance(entry, str):
+            continue
+        if "template" in entry:
+            entry["code"] = templates[entry.pop("template")]
+        elif "code" not in entry:
+            # This is a category with subcategories
+            _resolve_templates(entry, templates)
+
+@lru_cache(maxsize=None)
+def _compile_template(template):
+    """Split a "{text}" format template into the literal parts around each {text}"""
+    parts = [""]
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        parts[-1] += literal  # {{ and }} come back already unescaped
+        if field is None:
+            continue
+        if field != "text" or spec or conversion:
+            raise ValueError(f"Unsupported template field: {{{field}}}")
+        parts.append("")
+    return tuple(parts)
+
+def _make_entry(entry, category):
+    """Build a flat language entry with its template compiled"""
+    info = {"code": entry} if isinstance(entry, str) else entry
+    # Rendering is then text.join(parts)
+    info["parts"] = _compile_template(info.pop("code"))
+    info["category"] = category
+    return info
+
+def _flatten_languages(entries):
+    """Flatten category dicts into one {name: info} table plus {category: [names]}"""
+    languages = {}
+    categories = {}
+    for name, entry in entries.items():
+        if isinstance(entry, dict) and "code" not in entry:
+            # Members are kept pre-sorted (case-insensitive) for the listbox
+            categories[name] = sorted(entry, key=str.lower)
+        else:
+            languages[name] = _make_entry(entry, None)
+    for category, names in categories.items():
+        for name in names:
+            entry = entries[category][name]
+            # A language listed both at the top level and in a category keeps its top-level entry
+            if name not in languages:
+                languages[name] = _make_entry(entry, category)
+    return languages, categories
+
+def _intern_names(languages, categories):
+    """Return read-only tables with every language and category name interned"""
+    # Names are looked up on every click; interned keys let dict lookups match by identity
+    return (MappingProxyType({sys.intern(name): info for name, info in languages.items()}),
+            MappingProxyType({sys.intern(category): tuple(sys.intern(name) for name in names)
+                              for category, names in categories.items()}))
+
+def _read_languages_cache(stamp):
+    """Return the pickled language tables if they were built from this languages.json, else None"""
+    try:
+        with open(LANGUAGES_CACHE, "rb") as f:
+            if pickle.load(f) != stamp:
+                return None
+            # The table is many small containers; no need for the collector to track them while loading
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                return pickle.load(f)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+    except Exception:
+        return None  # Missing, stale or unreadable cache - rebuild from JSON
+
+def _write_languages_cache(stamp, tables):
+    """Save the resolved language tables for the next start-up (best effort)"""
+    try:
+        os.makedirs(os.path.dirname(LANGUAGES_CACHE), exist_ok=True)
+        with open(LANGUAGES_CACHE, "wb") as f:
+            pickle.dump(stamp, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(tables, f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Read-only install, just parse the JSON every time
+
+@lru_cache(maxsize=None)
+def _load_languages():
+    """Load the (languages, categories) tables from languages.json (parsed once per process)"""
+    stat = os.stat(LANGUAGES_FILE)
+    stamp = (_CACHE_FORMAT, stat.st_mtime_ns, stat.st_size)
+    tables = _read_languages_cache(stamp)
+    if tables is not None:
+        return _intern_names(*tables)
+    
+    with open(LANGUAGES_FILE, encoding="utf-8") as f:
+        data = json.load(f)
+    # Identical templates are stored once and shared by every language using them
+    entries = data["languages"]
+    _resolve_templates(entries, data["templates"])
+    tables = _flatten_languages(entries)
+    _write_languages_cache(stamp, tables)
+    return _intern_names(*tables)
+
+def _build_listing(languages, categories, compilation_commands, variant_compilation_commands):
+    """Return the sorted top-level listbox names and a display name -> entry map"""
+    # Case-insensitive alphabetical order, computed once rather than per window
+    top_level = [name for name, info in languages.items() if info["category"] is None]
+    sorted_names = tuple(sorted(top_level + list(categories), key=str.lower))
+    # Each entry is resolved up front to (template parts, compile command or None, bare name)
+    flat = {name: (languages[name]["parts"], compilation_commands.get(name), name)
+            for name in top_level}
+    for members in categories.values():
+        for name in members:
+            flat[sys.intern(f"  └─ {name}")] = (languages[name]["parts"],
+                                                variant_compilation_commands.get(name), name)
+    return sorted_names, MappingProxyType(flat)
+
+@lru_cache(maxsize=None)
+def _font_families(root):
+    """Installed font families, fetched from Tk once per root window"""
+    return frozenset(font.families(root))
+
+# Side of the repeating circuit pattern tile; a multiple of every spacing used in it
+CIRCUIT_TILE_SIZE = 360
+
+# Connection pad centres within one tile: along the horizontal traces (every 60 px on
+# each row) and along the vertical traces (every 60 px down each column), deduplicated
+_CIRCUIT_PADS = tuple(sorted(
+    {(x, y) for y in range(0, CIRCUIT_TILE_SIZE, 30) for x in range(15, CIRCUIT_TILE_SIZE, 60)}
+    | {(x, y) for x in range(0, CIRCUIT_TILE_SIZE, 30) for y in range(15, CIRCUIT_TILE_SIZE, 60)}
+))
+# Rows of a round pad 7 pixels across, as (dy, half width)
+_PAD_ROWS = ((-3, 1), (-2, 2), (-1, 3), (0, 3), (1, 3), (2, 2), (3, 1))
+
+# Languages whose templates put the text in markup rather than a string literal
+_MARKUP_LANGUAGES = frozenset({"HTML"})
+
+# Characters that need a backslash inside generated string literals
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', "'": "\\'"})
+_LITERAL_SPECIALS = frozenset(map(chr, _ESCAPE_TABLE))
+
+# Compilation commands for top-level languages, keyed by language name
+_COMPILATION_COMMANDS = {
+    "Java": "javac HelloWorld.java && java HelloWorld",
+    "C++": "g++ hello.cpp -o hello && ./hello",
+    "C#": "csc hello.cs && hello.exe",
+    "Go": "go build hello.go && ./hello",
+    "Rust": "rustc hello.rs && ./hello",
+    "Swift": "swiftc hello.swift -o hello && ./hello",
+    "Kotlin": "kotlinc hello.kt -include-runtime -d hello.jar && java -jar hello.jar",
+    "Scala": "scalac HelloWorld.scala && scala HelloWorld",
+    "Pascal": "fpc hello.pas && ./hello",
+    "Ada": "gnatmake hello_world.adb && ./hello_world",
+    "Nim": "nim compile --run hello.nim",
+    "Crystal": "crystal build hello.cr && ./hello",
+    "Zig": "zig run hello.zig",
+    "D": "dmd hello.d && ./hello",
+    "Haskell": "ghc hello.hs && ./hello",
+    "OCaml": "ocamlc -o hello hello.ml && ./hello",
+    "Oberon": "Compile with Oberon compiler",
+    "Modula-2": "Compile with Modula-2 compiler",
+    "Eiffel": "ec hello.e && ./hello",
+    "COBOL": "cobc -x hello.cob && ./hello",
+    "Objective-C": "gcc -framework Foundation hello.m -o hello && ./hello",
+    "Dart": "dart compile exe hello.dart && ./hello.exe",
+    "Groovy": "groovyc HelloWorld.groovy && java HelloWorld",
+    "Julia": "julia hello.jl",
+    "Solidity": "solc hello.sol",
+    "Vyper": "vyper hello.vy",
+    "ActionScript": "Compile with Adobe Flash/AIR SDK",
+    "Verilog": "iverilog -o hello hello.v && ./hello",
+    "VHDL": "ghdl -a hello.vhd && ghdl -e hello && ghdl -r hello",
+    "Forth": "gforth hello.fs",
+    "PostScript": "gs hello.ps",
+    "LaTeX": "pdflatex hello.tex",
+    "TeX": "tex hello.tex && dvipdf hello.dvi",
+    "AppleScript": "osascript hello.applescript",
+    "Bash": "bash hello.sh",
+    "csh": "csh hello.csh",
+    "Cray Fortran": "cft hello.f && a.out",
+    "Convex Fortran": "fc hello.f && a.out", 
+    "DCL (VMS)": "Run on VAX/VMS system",
+    "CAL (Cray Assembly)": "cal hello.cal && segldr hello && hello",
+    "JCL (Job Control Language)": "Submit to IBM mainframe job queue",
+    "IBM System/360 Assembly": "Assemble and link on IBM System/360",
+    "PL/I (IBM)": "pli hello.pli && hello",
+    "FOCAL (PDP-8)": "Run in FOCAL interpreter on PDP-8",
+    "RT-11 DCL": "Run on RT-11 operating system",
+}
+_COMPILATION_COMMANDS = {sys.intern(name): cmd for name, cmd in _COMPILATION_COMMANDS.items()}
+
+# Compilation commands for languages listed under a category, keyed by bare language name.
+# Kept apart from the top-level table: the top-level "Visual Basic" has no compile command
+_VARIANT_COMPILATION_COMMANDS = {
+    # C variants
+    "C (K&R)": "cc hello.c -o hello && ./hello",
+    "C89/C90 (ANSI C)": "gcc -std=c89 hello.c -o hello && ./hello",
+    "C99": "gcc -std=c99 hello.c -o hello && ./hello",
+    "C11": "gcc -std=c11 hello.c -o hello && ./hello",
+    "C17/C18": "gcc -std=c17 hello.c -o hello && ./hello",
+    "C23": "gcc -std=c2x hello.c -o hello && ./hello",
+    # Fortran variants
+    "FORTRAN 66": "f77 hello.f -o hello && ./hello",
+    "FORTRAN 77": "f77 hello.f -o hello && ./hello",
+    "Fortran 90": "gfortran hello.f90 -o hello && ./hello",
+    "Fortran 95": "gfortran -std=f95 hello.f95 -o hello && ./hello",
+    "Fortran 2003": "gfortran -std=f2003 hello.f03 -o hello && ./hello",
+    "Fortran 2008": "gfortran -std=f2008 hello.f08 -o hello && ./hello",
+    "Fortran 2018": "gfortran -std=f2018 hello.f18 -o hello && ./hello",
+    # BASIC variants (compiled ones)
+    "QuickBASIC": "qb hello.bas",
+    "FreeBASIC": "fbc hello.bas",
+    "PureBASIC": "pbcompiler hello.pb",
+    "PowerBASIC": "pbcc hello.bas",
+    "Gambas": "gbc3 -ag hello.gambas",
+    "B4X (Basic4android)": "Compile via B4A IDE",
+    "REALbasic/Xojo": "Compile via Xojo IDE",
+    "Visual Basic": "vbc hello.vb && hello.exe",
+    # Assembly variants
+    "x86-64 (AT&T)": "as hello.s -o hello.o && ld hello.o -o hello && ./hello",
+    "x86 (Intel)": "nasm -f elf32 hello.asm && ld -m elf_i386 hello.o -o hello && ./hello",
+    "68000 (Motorola)": "m68k-linux-gnu-as hello.s -o hello.o && m68k-linux-gnu-ld hello.o -o hello",
+    "6502": "ca65 hello.s && ld65 hello.o -o hello.prg",
+    "4004 (Intel)": "Assemble with Intel 4004 assembler",
+    "PDP-8": "Assemble with PAL-8 assembler",
+    "PDP-11": "macro hello.mac && link hello",
+}
+_VARIANT_COMPILATION_COMMANDS = {sys.intern(name): cmd for name, cmd in _VARIANT_COMPILATION_COMMANDS.items()}
 
 class HelloWorldGenerator:
+    # Programming languages with their code templates and compilation info
+    # Structure: language -> {parts: template split at {text}, type: compiled/interpreted, category: name or None}
+    # categories: category -> sorted member language names
+    # Compile commands live only in (variant_)compilation_commands, not in the language entries
+    # These read-only tables are shared by every window rather than rebuilt per instance
+    languages, categories = _load_languages()
+    compilation_commands = MappingProxyType(_COMPILATION_COMMANDS)
+    variant_compilation_commands = MappingProxyType(_VARIANT_COMPILATION_COMMANDS)
+    # Listbox order and display name -> (parts, compile command, bare name) lookup
+    sorted_languages, flat_languages = _build_listing(languages, categories, compilation_commands,
+                                                      variant_compilation_commands)
+    # "Is this listbox entry compiled?" answered with one set lookup; as before, that means it
+    # has a compile command (so top-level "Visual Basic" isn't, its BASIC variant is)
+    compiled_languages = frozenset(name for name, entry in flat_languages.items() if entry[1])
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Hello World Code Generator")
         self.root.geometry("900x700")
         
-        # Create circuit board background
-        self.create_circuit_background()
+        # Circuit board background tile; rendered on the first background draw (create_circuit_background),
+        # which runs from a timer after the window has painted rather than before the first frame
+        self.circuit_tile = None
         
         # Configure digital fonts
         self.digital_font = ("Courier New", 10, "bold")  # Fallback font
@@ -24,928 +283,79 @@ class HelloWorldGenerator:
         
         # Try to use more digital-looking fonts if available
         try:
-            # These fonts give a more digital/dot-matrix appearance
-            available_fonts = list(font.families())
-            if "OCR A Extended" in available_fonts:
-                self.digital_font = ("OCR A Extended", 10)
-                self.title_font = ("OCR A Extended", 16, "bold")
-                self.label_font = ("OCR A Extended", 12, "bold")
-            elif "Consolas" in available_fonts:
-                self.digital_font = ("Consolas", 10, "bold")
-                self.title_font = ("Consolas", 16, "bold")
-                self.label_font = ("Consolas", 12, "bold")
-            elif "Monaco" in available_fonts:
-                self.digital_font = ("Monaco", 10, "bold")
-                self.title_font = ("Monaco", 16, "bold")
-                self.label_font = ("Monaco", 12, "bold")
-        except:
-            pass  # Use fallback fonts
-        
-        # Programming languages with their code templates and compilation info
-        # Structure: language -> {code: template, compile: command, type: compiled/interpreted}
-        self.languages = {
-            "Python": {
-                "code": 'print("{text}")',
-                "type": "interpreted"
-            },
-            "JavaScript": {
-                "code": 'console.log("{text}");',
-                "type": "interpreted"
-            },
-            "Java": {
-                "code": '''public class HelloWorld {{
-    public static void main(String[] args) {{
-        System.out.println("{text}");
-    }}
-}}''',
-                "compile": "javac HelloWorld.java && java HelloWorld",
-                "type": "compiled"
-            },
-            "BASIC": {
-                "Atari BASIC": {
-                    "code": '''10 PRINT "{text}"
-20 END''',
-                    "type": "interpreted"
-                },
-                "Commodore BASIC": {
-                    "code": '''10 PRINT "{text}"
-20 END''',
-                    "type": "interpreted"
-                },
-                "Apple BASIC": {
-                    "code": '''10 PRINT "{text}"
-20 END''',
-                    "type": "interpreted"
-                },
-                "Microsoft BASIC": {
-                    "code": '''10 PRINT "{text}"
-20 END''',
-                    "type": "interpreted"
-                },
-                "GW-BASIC": {
-                    "code": '''10 PRINT "{text}"
-20 END''',
-                    "type": "interpreted"
-                },
-                "QBasic": {
-                    "code": '''PRINT "{text}"''',
-                    "type": "interpreted"
-                },
-                "QuickBASIC": {
-                    "code": '''PRINT "{text}"''',
-                    "compile": "qb hello.bas",
-                    "type": "compiled"
-                },
-                "FreeBASIC": {
-                    "code": '''PRINT "{text}"''',
-                    "compile": "fbc hello.bas",
-                    "type": "compiled"
-                },
-                "PureBASIC": {
-                    "code": '''PrintN("{text}")''',
-                    "compile": "pbcompiler hello.pb",
-                    "type": "compiled"
-                },
-                "BBC BASIC": {
-                    "code": '''PRINT "{text}"''',
-                    "type": "interpreted"
-                },
-                "Sinclair BASIC": {
-                    "code": '''10 PRINT "{text}"
-20 STOP''',
-                    "type": "interpreted"
-                },
-                "TI-BASIC": {
-                    "code": '''Disp "{text}"''',
-                    "type": "interpreted"
-                },
-                "HP BASIC": {
-                    "code": '''PRINT "{text}"''',
-                    "type": "interpreted"
-                },
-                "HP-71B BASIC": {
-                    "code": '''10 DISP "{text}"
-20 END''',
-                    "type": "interpreted"
-                },
-                "HP-75 BASIC": {
-                    "code": '''10 DISP "{text}"
-20 END''',
-                    "type": "interpreted"
-                },
-                "HP-85 BASIC": {
-                    "code": '''10 PRINT "{text}"
-20 END''',
-                    "type": "interpreted"
-                },
-                "BASICA": {
-                    "code": '''10 PRINT "{text}"
-20 END''',
-                    "type": "interpreted"
-                },
-                "True BASIC": {
-                    "code": '''PRINT "{text}"
-END''',
-                    "type": "interpreted"
-                },
-                "PowerBASIC": {
-                    "code": '''PRINT "{text}"''',
-                    "compile": "pbcc hello.bas",
-                    "type": "compiled"
-                },
-                "Liberty BASIC": {
-                    "code": '''print "{text}"
-end''',
-                    "type": "interpreted"
-                },
-                "Just BASIC": {
-                    "code": '''print "{text}"
-end''',
-                    "type": "interpreted"
-                },
-                "Yabasic": {
-                    "code": '''print "{text}"''',
-                    "type": "interpreted"
-                },
-                "Gambas": {
-                    "code": '''Print "{text}"''',
-                    "compile": "gbc3 -ag hello.gambas",
-                    "type": "compiled"
-                },
-                "B4X (Basic4android)": {
-                    "code": '''Log("{text}")''',
-                    "compile": "Compile via B4A IDE",
-                    "type": "compiled"
-                },
-                "REALbasic/Xojo": {
-                    "code": '''MsgBox("{text}")''',
-                    "compile": "Compile via Xojo IDE",
-                    "type": "compiled"
-                },
-                "Visual Basic": {
-                    "code": '''Module HelloWorld
-    Sub Main()
-        Console.WriteLine("{text}")
-    End Sub
-End Module''',
-                    "compile": "vbc hello.vb && hello.exe",
-                    "type": "compiled"
-                },
-            },
-            "C": {
-                "C (K&R)": {
-                    "code": '''#include <stdio.h>
-
-main()
-{{
-    printf("{text}\\n");
-}}''',
-                    "compile": "cc hello.c -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "C89/C90 (ANSI C)": {
-                    "code": '''#include <stdio.h>
-
-int main(void)
-{{
-    printf("{text}\\n");
-    return 0;
-}}''',
-                    "compile": "gcc -std=c89 hello.c -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "C99": {
-                    "code": '''#include <stdio.h>
-
-int main(void)
-{{
-    printf("{text}\\n");
-    return 0;
-}}''',
-                    "compile": "gcc -std=c99 hello.c -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "C11": {
-                    "code": '''#include <stdio.h>
-
-int main(void)
-{{
-    printf("{text}\\n");
-    return 0;
-}}''',
-                    "compile": "gcc -std=c11 hello.c -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "C17/C18": {
-                    "code": '''#include <stdio.h>
-
-int main(void)
-{{
-    printf("{text}\\n");
-    return 0;
-}}''',
-                    "compile": "gcc -std=c17 hello.c -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "C23": {
-                    "code": '''#include <stdio.h>
-
-int main(void)
-{{
-    printf("{text}\\n");
-    return 0;
-}}''',
-                    "compile": "gcc -std=c2x hello.c -o hello && ./hello",
-                    "type": "compiled"
-                },
-            },
-            "Fortran": {
-                "FORTRAN 66": {
-                    "code": '''      PROGRAM HELLO
-      PRINT *, '{text}'
-      END''',
-                    "compile": "f77 hello.f -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "FORTRAN 77": {
-                    "code": '''      PROGRAM HELLO
-      PRINT *, '{text}'
-      END''',
-                    "compile": "f77 hello.f -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "Fortran 90": {
-                    "code": '''program hello
-    print *, '{text}'
-end program hello''',
-                    "compile": "gfortran hello.f90 -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "Fortran 95": {
-                    "code": '''program hello
-    print *, '{text}'
-end program hello''',
-                    "compile": "gfortran -std=f95 hello.f95 -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "Fortran 2003": {
-                    "code": '''program hello
-    use iso_fortran_env, only: output_unit
-    write(output_unit, '(a)') '{text}'
-end program hello''',
-                    "compile": "gfortran -std=f2003 hello.f03 -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "Fortran 2008": {
-                    "code": '''program hello
-    use iso_fortran_env, only: output_unit
-    write(output_unit, '(a)') '{text}'
-end program hello''',
-                    "compile": "gfortran -std=f2008 hello.f08 -o hello && ./hello",
-                    "type": "compiled"
-                },
-                "Fortran 2018": {
-                    "code": '''program hello
-    use iso_fortran_env, only: output_unit
-    write(output_unit, '(a)') '{text}'
-end program hello''',
-                    "compile": "gfortran -std=f2018 hello.f18 -o hello && ./hello",
-                    "type": "compiled"
-                },
-            },
-            "C++": {
-                "code": '''#include <iostream>
-
-int main() {{
-    std::cout << "{text}" << std::endl;
-    return 0;
-}}''',
-                "compile": "g++ hello.cpp -o hello && ./hello",
-                "type": "compiled"
-            },
-            "C#": {
-                "code": '''using System;
-
-class Program {{
-    static void Main() {{
-        Console.WriteLine("{text}");
-    }}
-}}''',
-                "compile": "csc hello.cs && hello.exe",
-                "type": "compiled"
-            },
-            "Go": {
-                "code": '''package main
-
-import "fmt"
-
-func main() {{
-    fmt.Println("{text}")
-}}''',
-                "compile": "go build hello.go && ./hello",
-                "type": "compiled"
-            },
-            "Rust": {
-                "code": '''fn main() {{
-    println!("{text}");
-}}''',
-                "compile": "rustc hello.rs && ./hello",
-                "type": "compiled"
-            },
-            "Ruby": 'puts "{text}"',
-            "PHP": '<?php\necho "{text}\\n";\n?>',
-            "Swift": 'print("{text}")',
-            "Kotlin": '''fun main() {{
-    println("{text}")
-}}''',
-            "Scala": '''object HelloWorld {{
-    def main(args: Array[String]): Unit = {{
-        println("{text}")
-    }}
-}}''',
-            "R": 'cat("{text}\\n")',
-            "MATLAB": 'fprintf("{text}\\n");',
-            "Perl": 'print "{text}\\n";',
-            "Lua": 'print("{text}")',
-            "Haskell": '''main :: IO ()
-main = putStrLn "{text}"''',
-            "Erlang": '''main() ->
-    io:format("{text}~n").''',
-            "Elixir": 'IO.puts("{text}")',
-            "Clojure": '(println "{text}")',
-            "F#": 'printfn "{text}"',
-            "Visual Basic": '''Module HelloWorld
-    Sub Main()
-        Console.WriteLine("{text}")
-    End Sub
-End Module''',
-            "Pascal": '''program HelloWorld;
-begin
-    writeln('{text}');
-end.''',
-            "COBOL": '''IDENTIFICATION DIVISION.
-PROGRAM-ID. HELLO-WORLD.
-PROCEDURE DIVISION.
-DISPLAY '{text}'.
-STOP RUN.''',
-
-            "Bash": 'echo "{text}"',
-            "PowerShell": 'Write-Host "{text}"',
-            "SQL": 'SELECT \'{text}\' AS message;',
-            "HTML": '''<!DOCTYPE html>
-<html>
-<head>
-    <title>Hello World</title>
-</head>
-<body>
-    <h1>{text}</h1>
-</body>
-</html>''',
-            "CSS": '''body::before {{
-    content: "{text}";
-    font-size: 24px;
-    font-weight: bold;
-}}''',
-            "Dart": '''void main() {{
-    print('{text}');
-}}''',
-            "TypeScript": 'console.log("{text}");',
-            "Objective-C": '''#import <Foundation/Foundation.h>
-
-int main() {{
-    NSLog(@"{text}");
-    return 0;
-}}''',
-            "Groovy": 'println "{text}"',
-            "Julia": 'println("{text}")',
-            "Nim": 'echo "{text}"',
-            "Crystal": 'puts "{text}"',
-            "Zig": '''const std = @import("std");
-
-pub fn main() void {{
-    std.debug.print("{text}\\n", .{{}});
-}}''',
-            "D": '''import std.stdio;
-
-void main() {{
-    writeln("{text}");
-}}''',
-            "OCaml": 'print_endline "{text}";;',
-            "Scheme": '(display "{text}")\\n(newline)',
-            "Racket": '#lang racket\\n(displayln "{text}")',
-            "Common Lisp": '(format t "{text}~%")',
-            "Prolog": '''hello_world :-
-    write('{text}'), nl.
-
-:- hello_world.''',
-            "Smalltalk": "Transcript show: '{text}'; cr.",
-            "Ada": '''with Ada.Text_IO;
-
-procedure Hello_World is
-begin
-    Ada.Text_IO.Put_Line("{text}");
-end Hello_World;''',
-            "Tcl": 'puts "{text}"',
-            "Verilog": '''module hello_world;
-    initial begin
-        $display("{text}");
-        $finish;
-    end
-endmodule''',
-            "VHDL": '''library IEEE;
-use IEEE.STD_LOGIC_1164.ALL;
-
-entity hello_world is
-end hello_world;
-
-architecture Behavioral of hello_world is
-begin
-    process
-    begin
-        report "{text}";
-        wait;
-    end process;
-end Behavioral;''',
-            "ActionScript": '''package {{
-    import flash.display.Sprite;
-    import flash.text.TextField;
-    
-    public class HelloWorld extends Sprite {{
-        public function HelloWorld() {{
-            var txt:TextField = new TextField();
-            txt.text = "{text}";
-            addChild(txt);
-        }}
-    }}
-}}''',
-            "CoffeeScript": 'console.log "{text}"',
-            "Elm": '''module Main exposing (..)
-
-import Html exposing (text)
-
-main =
-    text "{text}"''',
-            "PureScript": '''module Main where
-
-import Prelude
-import Effect.Console (log)
-
-main = log "{text}"''',
-            "ReasonML": 'Js.log("{text}");',
-            "Solidity": '''pragma solidity ^0.8.0;
-
-contract HelloWorld {{
-    function sayHello() public pure returns (string memory) {{
-        return "{text}";
-    }}
-}}''',
-            "Vyper": '''@external
-@view
-def hello_world() -> String[100]:
-    return "{text}"''',
-            "Oberon": '''MODULE HelloWorld;
-IMPORT Out;
-BEGIN
-    Out.String("{text}");
-    Out.Ln
-END HelloWorld.''',
-            "Modula-2": '''MODULE HelloWorld;
-FROM InOut IMPORT WriteString, WriteLn;
-BEGIN
-    WriteString("{text}");
-    WriteLn
-END HelloWorld.''',
-            "C#": '''using System;
-
-class Program {{
-    static void Main() {{
-        Console.WriteLine("{text}");
-    }}
-}}''',
-            "Go": '''package main
-
-import "fmt"
-
-func main() {{
-    fmt.Println("{text}")
-}}''',
-            "Rust": '''fn main() {{
-    println!("{text}");
-}}''',
-            "Ruby": 'puts "{text}"',
-            "PHP": '<?php\necho "{text}\\n";\n?>',
-            "Swift": 'print("{text}")',
-            "Kotlin": '''fun main() {{
-    println("{text}")
-}}''',
-            "Scala": '''object HelloWorld {{
-    def main(args: Array[String]): Unit = {{
-        println("{text}")
-    }}
-}}''',
-            "R": 'cat("{text}\\n")',
-            "MATLAB": 'fprintf("{text}\\n");',
-            "Perl": 'print "{text}\\n";',
-            "Lua": 'print("{text}")',
-            "Haskell": '''main :: IO ()
-main = putStrLn "{text}"''',
-            "Erlang": '''main() ->
-    io:format("{text}~n").''',
-            "Elixir": 'IO.puts("{text}")',
-            "Clojure": '(println "{text}")',
-            "F#": 'printfn "{text}"',
-            "Visual Basic": '''Module HelloWorld
-    Sub Main()
-        Console.WriteLine("{text}")
-    End Sub
-End Module''',
-            "Pascal": '''program HelloWorld;
-begin
-    writeln('{text}');
-end.''',
-            "Fortran": '''program hello
-    print *, '{text}'
-end program hello''',
-            "COBOL": '''IDENTIFICATION DIVISION.
-PROGRAM-ID. HELLO-WORLD.
-PROCEDURE DIVISION.
-DISPLAY '{text}'.
-STOP RUN.''',
-
-            "Bash": 'echo "{text}"',
-            "PowerShell": 'Write-Host "{text}"',
-            "SQL": 'SELECT \'{text}\' AS message;',
-            "HTML": '''<!DOCTYPE html>
-<html>
-<head>
-    <title>Hello World</title>
-</head>
-<body>
-    <h1>{text}</h1>
-</body>
-</html>''',
-            "CSS": '''body::before {{
-    content: "{text}";
-    font-size: 24px;
-    font-weight: bold;
-}}''',
-            "Dart": '''void main() {{
-    print('{text}');
-}}''',
-            "TypeScript": 'console.log("{text}");',
-            "Objective-C": '''#import <Foundation/Foundation.h>
-
-int main() {{
-    NSLog(@"{text}");
-    return 0;
-}}''',
-            "Groovy": 'println "{text}"',
-            "Julia": 'println("{text}")',
-            "Nim": 'echo "{text}"',
-            "Crystal": 'puts "{text}"',
-            "Zig": '''const std = @import("std");
-
-pub fn main() void {{
-    std.debug.print("{text}\\n", .{{}});
-}}''',
-            "D": '''import std.stdio;
-
-void main() {{
-    writeln("{text}");
-}}''',
-            "OCaml": 'print_endline "{text}";;',
-            "Scheme": '(display "{text}")\\n(newline)',
-            "Racket": '#lang racket\\n(displayln "{text}")',
-            "Common Lisp": '(format t "{text}~%")',
-            "Prolog": '''hello_world :-
-    write('{text}'), nl.
-
-:- hello_world.''',
-            "Smalltalk": "Transcript show: '{text}'; cr.",
-            "Ada": '''with Ada.Text_IO;
-
-procedure Hello_World is
-begin
-    Ada.Text_IO.Put_Line("{text}");
-end Hello_World;''',
-            "Tcl": 'puts "{text}"',
-            "Verilog": '''module hello_world;
-    initial begin
-        $display("{text}");
-        $finish;
-    end
-endmodule''',
-            "VHDL": '''library IEEE;
-use IEEE.STD_LOGIC_1164.ALL;
-
-entity hello_world is
-end hello_world;
-
-architecture Behavioral of hello_world is
-begin
-    process
-    begin
-        report "{text}";
-        wait;
-    end process;
-end Behavioral;''',
-            "ActionScript": '''package {{
-    import flash.display.Sprite;
-    import flash.text.TextField;
-    
-    public class HelloWorld extends Sprite {{
-        public function HelloWorld() {{
-            var txt:TextField = new TextField();
-            txt.text = "{text}";
-            addChild(txt);
-        }}
-    }}
-}}''',
-            "CoffeeScript": 'console.log "{text}"',
-            "Elm": '''module Main exposing (..)
-
-import Html exposing (text)
-
-main =
-    text "{text}"''',
-            "PureScript": '''module Main where
-
-import Prelude
-import Effect.Console (log)
-
-main = log "{text}"''',
-            "ReasonML": 'Js.log("{text}");',
-            "Solidity": '''pragma solidity ^0.8.0;
-
-contract HelloWorld {{
-    function sayHello() public pure returns (string memory) {{
-        return "{text}";
-    }}
-}}''',
-            "Vyper": '''@external
-@view
-def hello_world() -> String[100]:
-    return "{text}"''',
-            "Oberon": '''MODULE HelloWorld;
-IMPORT Out;
-BEGIN
-    Out.String("{text}");
-    Out.Ln
-END HelloWorld.''',
-            "Modula-2": '''MODULE HelloWorld;
-FROM InOut IMPORT WriteString, WriteLn;
-BEGIN
-    WriteString("{text}");
-    WriteLn
-END HelloWorld.''',
-            "REXX": '''/* REXX */
-say "{text}"''',
-            "AREXX": '''/* AREXX - Amiga REXX */
-say "{text}"''',
-            "Eiffel": '''class
-    HELLO_WORLD
-
-create
-    make
-
-feature
-    make
-        do
-            print("{text}%N")
-        end
-
-end''',
-            "Forth": '''." {text}" CR''',
-            "APL": '''⎕←'{text}' ''',
-            "AppleScript": '''display dialog "{text}"''',
-            "Bash": '''#!/bin/bash
-echo "{text}"''',
-            "csh": '''#!/bin/csh
-echo "{text}"''',
-            "Cray Fortran": '''C     Cray Fortran (CFT)
-      PROGRAM HELLO
-      WRITE(6,100) '{text}'
-100   FORMAT(A)
-      END''',
-            "Convex Fortran": '''C     Convex Fortran
-      PROGRAM HELLO
-      WRITE(*,*) '{text}'
-      END''',
-            "DCL (VMS)": '''$ WRITE SYS$OUTPUT "{text}"''',
-            "CAL (Cray Assembly)": '''        IDENT   HELLO
-        ENTRY   START
-START   S1      A1,=C'{text}'
-        S2      A2,13
-        CALL    WRITE
-        J       EXIT
-        END''',
-            "JCL (Job Control Language)": '''//HELLO    JOB  CLASS=A,MSGCLASS=A
-//STEP1    EXEC PGM=IEBGENER
-//SYSPRINT DD   SYSOUT=*
-//SYSUT1   DD   *
-{text}
-/*
-//SYSUT2   DD   SYSOUT=*
-//SYSIN    DD   DUMMY''',
-            "IBM System/360 Assembly": '''HELLO    CSECT
-         USING *,15
-         WTO   '{text}',ROUTCDE=11
-         BR    14
-         END   HELLO''',
-            "PL/I (IBM)": '''HELLO: PROCEDURE OPTIONS(MAIN);
-   PUT SKIP LIST('{text}');
-END HELLO;''',
-            "FOCAL (PDP-8)": '''01.10 TYPE "{text}"
-01.20 QUIT''',
-            "RT-11 DCL": '''TYPE "{text}"''',
-            "J": '''echo '{text}' ''',
-            "K": '''`0:"{text}"''',
-            "PostScript": '''({text}) show
-showpage''',
-            "Logo": '''print "{text}"''',
-            "LaTeX": '''\\documentclass{{article}}
-\\begin{{document}}
-{text}
-\\end{{document}}''',
-            "TeX": '''{text}
-\\bye''',
-            "Assembly Variants": {
-                "x86-64 (AT&T)": '''.section .data
-    msg: .ascii "{text}\\n"
-    msg_len = . - msg
-
-.section .text
-    .global _start
-
-_start:
-    mov $1, %rax
-    mov $1, %rdi
-    mov $msg, %rsi
-    mov $msg_len, %rdx
-    syscall
-    
-    mov $60, %rax
-    mov $0, %rdi
-    syscall''',
-                "x86 (Intel)": '''section .data
-    msg db '{text}', 0xA
-    msg_len equ $ - msg
-
-section .text
-    global _start
-
-_start:
-    mov eax, 4
-    mov ebx, 1
-    mov ecx, msg
-    mov edx, msg_len
-    int 0x80
-    
-    mov eax, 1
-    mov ebx, 0
-    int 0x80''',
-                "68000 (Motorola)": '''    section .data
-msg:    dc.b    '{text}',10,0
-
-    section .text
-    global  _start
-
-_start:
-    move.l  #4,d0       ; sys_write
-    move.l  #1,d1       ; stdout
-    move.l  #msg,d2     ; message
-    move.l  #13,d3      ; length
-    trap    #0
-    
-    move.l  #1,d0       ; sys_exit
-    move.l  #0,d1       ; exit status
-    trap    #0''',
-                "6502": '''        LDX #0
-LOOP:   LDA MESSAGE,X
-        BEQ DONE
-        JSR $FFD2       ; CHROUT
-        INX
-        BNE LOOP
-DONE:   RTS
-
-MESSAGE:
-        .BYTE "{text}",13,0''',
-                "4004 (Intel)": '''; Intel 4004 Assembly
-        FIM P0, >MSG    ; Load message address
-        FIM P1, <MSG
-LOOP:   SRC P0          ; Set ROM address
-        RDM             ; Read from ROM
-        JCN ZN, END     ; Jump if zero
-        WMP             ; Write to output port
-        INC R0          ; Increment address
-        JUN LOOP        ; Jump to loop
-END:    HLT             ; Halt
-
-MSG:    DATA "{text}"
-        DATA 0''',
-                "PDP-8": '''        *200
-START,  CLA CLL
-        TAD MSG
-        JMS PRINT
-        HLT
-MSG,    TEXT /{text}/
-        PAGE''',
-                "PDP-11": '''        .TITLE  HELLO
-        .MCALL  .PRINT, .EXIT
-START:  .PRINT  #MSG
-        .EXIT
-MSG:    .ASCII  /{text}/<15><12>
-        .END    START''',
-            },
-        }
-        
-        # Compilation commands for compiled languages
-        self.compilation_commands = {
-            "Java": "javac HelloWorld.java && java HelloWorld",
-            "C++": "g++ hello.cpp -o hello && ./hello",
-            "C#": "csc hello.cs && hello.exe",
-            "Go": "go build hello.go && ./hello",
-            "Rust": "rustc hello.rs && ./hello",
-            "Swift": "swiftc hello.swift -o hello && ./hello",
-            "Kotlin": "kotlinc hello.kt -include-runtime -d hello.jar && java -jar hello.jar",
-            "Scala": "scalac HelloWorld.scala && scala HelloWorld",
-            "Pascal": "fpc hello.pas && ./hello",
-            "Ada": "gnatmake hello_world.adb && ./hello_world",
-            "Nim": "nim compile --run hello.nim",
-            "Crystal": "crystal build hello.cr && ./hello",
-            "Zig": "zig run hello.zig",
-            "D": "dmd hello.d && ./hello",
-            "Haskell": "ghc hello.hs && ./hello",
-            "OCaml": "ocamlc -o hello hello.ml && ./hello",
-            "Oberon": "Compile with Oberon compiler",
-            "Modula-2": "Compile with Modula-2 compiler",
-            "Eiffel": "ec hello.e && ./hello",
-            "COBOL": "cobc -x hello.cob && ./hello",
-            "Objective-C": "gcc -framework Foundation hello.m -o hello && ./hello",
-            "Dart": "dart compile exe hello.dart && ./hello.exe",
-            "Groovy": "groovyc HelloWorld.groovy && java HelloWorld",
-            "Julia": "julia hello.jl",
-            "Solidity": "solc hello.sol",
-            "Vyper": "vyper hello.vy",
-            "ActionScript": "Compile with Adobe Flash/AIR SDK",
-            "Verilog": "iverilog -o hello hello.v && ./hello",
-            "VHDL": "ghdl -a hello.vhd && ghdl -e hello && ghdl -r hello",
-            "Forth": "gforth hello.fs",
-            "PostScript": "gs hello.ps",
-            "LaTeX": "pdflatex hello.tex",
-            "TeX": "tex hello.tex && dvipdf hello.dvi",
-            "AppleScript": "osascript hello.applescript",
-            "Bash": "bash hello.sh",
-            "csh": "csh hello.csh",
-            "Cray Fortran": "cft hello.f && a.out",
-            "Convex Fortran": "fc hello.f && a.out", 
-            "DCL (VMS)": "Run on VAX/VMS system",
-            "CAL (Cray Assembly)": "cal hello.cal && segldr hello && hello",
-            "JCL (Job Control Language)": "Submit to IBM mainframe job queue",
-            "IBM System/360 Assembly": "Assemble and link on IBM System/360",
-            "PL/I (IBM)": "pli hello.pli && hello",
-            "FOCAL (PDP-8)": "Run in FOCAL interpreter on PDP-8",
-            "RT-11 DCL": "Run on RT-11 operating system",
-            # C variants
-            "  └─ C (K&R)": "cc hello.c -o hello && ./hello",
-            "  └─ C89/C90 (ANSI C)": "gcc -std=c89 hello.c -o hello && ./hello",
-            "  └─ C99": "gcc -std=c99 hello.c -o hello && ./hello",
-            "  └─ C11": "gcc -std=c11 hello.c -o hello && ./hello",
-            "  └─ C17/C18": "gcc -std=c17 hello.c -o hello && ./hello",
-            "  └─ C23": "gcc -std=c2x hello.c -o hello && ./hello",
-            # Fortran variants
-            "  └─ FORTRAN 66": "f77 hello.f -o hello && ./hello",
-            "  └─ FORTRAN 77": "f77 hello.f -o hello && ./hello",
-            "  └─ Fortran 90": "gfortran hello.f90 -o hello && ./hello",
-            "  └─ Fortran 95": "gfortran -std=f95 hello.f95 -o hello && ./hello",
-            "  └─ Fortran 2003": "gfortran -std=f2003 hello.f03 -o hello && ./hello",
-            "  └─ Fortran 2008": "gfortran -std=f2008 hello.f08 -o hello && ./hello",
-            "  └─ Fortran 2018": "gfortran -std=f2018 hello.f18 -o hello && ./hello",
-            # BASIC variants (compiled ones)
-            "  └─ QuickBASIC": "qb hello.bas",
-            "  └─ FreeBASIC": "fbc hello.bas",
-            "  └─ PureBASIC": "pbcompiler hello.pb",
-            "  └─ PowerBASIC": "pbcc hello.bas",
-            "  └─ Gambas": "gbc3 -ag hello.gambas",
-            "  └─ B4X (Basic4android)": "Compile via B4A IDE",
-            "  └─ REALbasic/Xojo": "Compile via Xojo IDE",
-            "  └─ Visual Basic": "vbc hello.vb && hello.exe",
-            # Assembly variants
-            "  └─ x86-64 (AT&T)": "as hello.s -o hello.o && ld hello.o -o hello && ./hello",
-            "  └─ x86 (Intel)": "nasm -f elf32 hello.asm && ld -m elf_i386 hello.o -o hello && ./hello",
-            "  └─ 68000 (Motorola)": "m68k-linux-gnu-as hello.s -o hello.o && m68k-linux-gnu-ld hello.o -o hello",
-            "  └─ 6502": "ca65 hello.s && ld65 hello.o -o hello.prg",
-            "  └─ 4004 (Intel)": "Assemble with Intel 4004 assembler",
-            "  └─ PDP-8": "Assemble with PAL-8 assembler",
-            "  └─ PDP-11": "macro hello.mac && link hello",
-        }
+            available_fonts = _font_families(self.root)
+        except tk.TclError:
+            available_fonts = frozenset()  # Use fallback fonts
+        
+        # These fonts give a more digital/dot-matrix appearance
+        for name in ("OCR A Extended", "Consolas", "Monaco"):
+            if name in available_fonts:
+                # OCR A Extended is used without bold for body text
+                self.digital_font = (name, 10) if name == "OCR A Extended" else (name, 10, "bold")
+                self.title_font = (name, 16, "bold")
+                self.label_font = (name, 12, "bold")
+                break
+        
+        # Prime Tk's font metric cache with hidden off-screen labels so the
+        # first paint of the real widgets doesn't stall measuring each font
+        self._primed_fonts = [font.Font(self.root, font=f)
+                              for f in (self.digital_font, self.title_font, self.label_font)]
+        for primed in self._primed_fonts:
+            tk.Label(self.root, font=primed).place(x=-1000, y=-1000)
+        
+        # (custom text, language) of the last generated code, to skip redundant re-renders
+        self._last_render = None
+        # Pending debounced re-render after a key release
+        self._regen_job = None
         
         self.setup_ui()
         
     def create_circuit_background(self):
-        """Create a subtle circuit board pattern background using tkinter Canvas"""
-        # We'll create this dynamically in the UI setup since we need the window size
-        pass
+        """Render one repeating tile of the circuit board pattern into a PhotoImage"""
+        size = CIRCUIT_TILE_SIZE
+        trace_color = '#404040'
+        pad_color = '#505050'
+        component_color = '#606060'
+        # The tile is painted as rows of colors in Python and handed to Tk in one put()
+        rows = [['#2a2a2a'] * size for _ in range(size)]
+        
+        def fill_span(color, x1, x2, y):
+            # Fill x1..x2 on row y, wrapping around the tile edges like the repeated pattern does
+            row = rows[y % size]
+            if x1 < 0:
+                row[x1 % size:] = [color] * -x1
+                x1 = 0
+            row[x1:x2 + 1] = [color] * (x2 + 1 - x1)
+        
+        # Horizontal and vertical traces
+        for y in range(0, size, 30):
+            fill_span(trace_color, 0, size - 1, y)
+        for x in range(0, size, 30):
+            for row in rows:
+                row[x] = trace_color
+        
+        # Connection pads (they sit between trace crossings, so drawing them after is equivalent)
+        for x, y in _CIRCUIT_PADS:
+            for dy, half_width in _PAD_ROWS:
+                fill_span(pad_color, x - half_width, x + half_width, y + dy)
+        
+        # Diagonal traces
+        for i in range(0, size, 90):
+            for j in range(0, size, 90):
+                for t in range(45):
+                    rows[j + t][i + t] = trace_color
+                    rows[j + t][i + 45 - t] = trace_color
+        
+        # Small components (rectangles)
+        for x in range(45, size, 120):
+            for y in range(45, size, 120):
+                for row_y in range(y - 4, y + 5):
+                    fill_span(component_color, x - 8, x + 8, row_y)
+        
+        tile = tk.PhotoImage(master=self.root, width=size, height=size)
+        tile.put(" ".join("{" + " ".join(row) + "}" for row in rows))
+        # Kept on self so the image isn't garbage collected while in use
+        self.circuit_tile = tile
     
     def setup_ui(self):
         # Set the background color to match circuit board
@@ -955,52 +365,48 @@ MSG:    .ASCII  /{text}/<15><12>
         main_frame = tk.Frame(self.root, bg='#2a2a2a')
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Create a canvas for circuit board background
+        # Create a canvas for circuit board background; it is its own layer beneath content_frame
         self.bg_canvas = tk.Canvas(main_frame, highlightthickness=0, bg='#2a2a2a')
         self.bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
         
-        # Draw circuit board pattern
+        # Draw circuit board pattern by tiling the pre-rendered tile across the canvas
+        self.circuit_image = None
+        self._circuit_size = None
+        self._circuit_job = None
+        
         def draw_circuit_pattern():
-            self.bg_canvas.delete("circuit")
+            self._circuit_job = None
             canvas_width = self.bg_canvas.winfo_width()
             canvas_height = self.bg_canvas.winfo_height()
             
-            if canvas_width > 1 and canvas_height > 1:  # Make sure canvas is initialized
-                # Draw grid pattern
-                trace_color = '#404040'
-                pad_color = '#505050'
-                component_color = '#606060'
-                
-                # Horizontal traces
-                for y in range(0, canvas_height, 30):
-                    self.bg_canvas.create_line(0, y, canvas_width, y, fill=trace_color, width=1, tags="circuit")
-                    # Add connection pads
-                    for x in range(15, canvas_width, 60):
-                        self.bg_canvas.create_oval(x-3, y-3, x+3, y+3, fill=pad_color, outline=pad_color, tags="circuit")
-                
-                # Vertical traces
-                for x in range(0, canvas_width, 30):
-                    self.bg_canvas.create_line(x, 0, x, canvas_height, fill=trace_color, width=1, tags="circuit")
-                    # Add connection pads
-                    for y in range(15, canvas_height, 60):
-                        self.bg_canvas.create_oval(x-3, y-3, x+3, y+3, fill=pad_color, outline=pad_color, tags="circuit")
-                
-                # Add some diagonal traces
-                for i in range(0, canvas_width, 90):
-                    for j in range(0, canvas_height, 90):
-                        self.bg_canvas.create_line(i, j, i+45, j+45, fill=trace_color, width=1, tags="circuit")
-                        self.bg_canvas.create_line(i+45, j, i, j+45, fill=trace_color, width=1, tags="circuit")
-                
-                # Add small components (rectangles)
-                for x in range(45, canvas_width, 120):
-                    for y in range(45, canvas_height, 120):
-                        self.bg_canvas.create_rectangle(x-8, y-4, x+8, y+4, fill=component_color, outline=component_color, tags="circuit")
-                
-                # Send circuit pattern to back
-                self.bg_canvas.tag_lower("circuit")
+            if canvas_width <= 1 or canvas_height <= 1:  # Make sure canvas is initialized
+                return
+            if (canvas_width, canvas_height) == self._circuit_size:
+                return  # Configure without a size change, nothing to redraw
+            self._circuit_size = (canvas_width, canvas_height)
+            
+            if self.circuit_tile is None:
+                self.create_circuit_background()
+            if self.circuit_image is None:
+                # The canvas only ever holds this one image item, so no z-ordering is needed;
+                # it stays put and just shows whatever the image is resized and refilled to
+                self.circuit_image = tk.PhotoImage(master=self.root)
+                self.bg_canvas.create_image(0, 0, anchor=tk.NW, image=self.circuit_image, tags="circuit")
+            self.circuit_image.configure(width=canvas_width, height=canvas_height)
+            # Tk's "copy -to" repeats the source image to fill the target region
+            self.root.tk.call(self.circuit_image, 'copy', self.circuit_tile, '-to', 0, 0, canvas_width, canvas_height)
+        
+        def schedule_circuit_redraw(event):
+            # Parent reflows re-fire Configure without a size change; ignore those
+            if (event.width, event.height) == self._circuit_size:
+                return
+            # Coalesce a resize drag into one redraw 50 ms after the last event
+            if self._circuit_job is not None:
+                self.root.after_cancel(self._circuit_job)
+            self._circuit_job = self.root.after(50, draw_circuit_pattern)
         
         # Bind canvas resize to redraw pattern
-        self.bg_canvas.bind('<Configure>', lambda e: self.root.after(10, draw_circuit_pattern))
+        self.bg_canvas.bind('<Configure>', schedule_circuit_redraw)
         
         # Create content frame with semi-transparent background
         content_frame = tk.Frame(main_frame, bg='#1a1a1a', relief=tk.RAISED, bd=2)
@@ -1034,7 +440,16 @@ MSG:    .ASCII  /{text}/<15><12>
         listbox_frame = tk.Frame(left_frame, bg='#1a1a1a')
         listbox_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Populate language list with hierarchical structure - CASE-INSENSITIVE ALPHABETICALLY SORTED
+        # Categories start collapsed ("▶"); members are inserted when first expanded
+        self.expanded_categories = set()
+        display_names = tuple(f"▶ {key}" if key in self.categories else key
+                              for key in self.sorted_languages)
+        # Handed to Tk as one list variable rather than an insert() per row
+        self.language_var = tk.StringVar(value=display_names)
+        
         self.language_listbox = tk.Listbox(listbox_frame, 
+                                          listvariable=self.language_var,
                                           width=25, 
                                           font=self.digital_font,
                                           bg='#000000',  # Black background
@@ -1048,30 +463,11 @@ MSG:    .ASCII  /{text}/<15><12>
         self.language_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Populate language list with hierarchical structure - CASE-INSENSITIVE ALPHABETICALLY SORTED
-        self.flat_languages = {}  # Flattened for easy lookup
-        
-        # Sort the main language keys alphabetically (case-insensitive)
-        sorted_languages = sorted(self.languages.keys(), key=str.lower)
-        
-        for key in sorted_languages:
-            value = self.languages[key]
-            if isinstance(value, dict) and "code" not in value:
-                # This is a category with subcategories
-                self.language_listbox.insert(tk.END, f"▼ {key}")
-                # Sort subcategories alphabetically too (case-insensitive)
-                for subkey in sorted(value.keys(), key=str.lower):
-                    subvalue = value[subkey]
-                    display_name = f"  └─ {subkey}"
-                    self.language_listbox.insert(tk.END, display_name)
-                    self.flat_languages[display_name] = subvalue
-            else:
-                # This is a direct language
-                self.language_listbox.insert(tk.END, key)
-                self.flat_languages[key] = value
-        
-        # Bind selection event
+        # Bind selection event; category headers only toggle on a click or Return, so
+        # arrowing through the list doesn't expand or collapse every header it passes
         self.language_listbox.bind('<<ListboxSelect>>', self.on_language_select)
+        self.language_listbox.bind('<ButtonRelease-1>', self.on_header_activate)
+        self.language_listbox.bind('<Return>', self.on_header_activate)
         
         # Right panel - Code generation
         right_frame = tk.Frame(main_content, bg='#1a1a1a')
@@ -1135,6 +531,7 @@ MSG:    .ASCII  /{text}/<15><12>
         
         # Initially hide compilation section
         self.compile_frame.pack_forget()
+        self._compile_visible = False
         
         # Buttons frame
         button_frame = tk.Frame(right_frame, bg='#1a1a1a')
@@ -1179,70 +576,123 @@ MSG:    .ASCII  /{text}/<15><12>
         """Handle language selection from the listbox"""
         selection = self.language_listbox.curselection()
         if selection:
-            selected_item = self.language_listbox.get(selection[0])
-            # Skip category headers (those starting with ▼)
-            if selected_item.startswith("▼"):
+            selected_item = sys.intern(self.language_listbox.get(selection[0]))
+            # Skip category headers (▶ collapsed / ▼ expanded); see on_header_activate
+            if selected_item.startswith(("▶", "▼")):
                 return
             # Generate code for the selected language/sublanguage
             if selected_item in self.flat_languages:
                 self.generate_code_from_template(selected_item, self.flat_languages[selected_item])
             
-    def on_text_change(self, event):
-        """Handle custom text changes"""
+    def on_header_activate(self, event):
+        """Expand or collapse the selected category header on a click or Return"""
         selection = self.language_listbox.curselection()
         if selection:
             selected_item = self.language_listbox.get(selection[0])
-            if not selected_item.startswith("▼") and selected_item in self.flat_languages:
+            if selected_item.startswith(("▶", "▼")):
+                self.toggle_category(selection[0], selected_item[2:])
+            
+    def on_text_change(self, event):
+        """Handle custom text changes, waiting for a pause in typing before re-rendering"""
+        if self._regen_job is not None:
+            self.root.after_cancel(self._regen_job)
+        self._regen_job = self.root.after(120, self.regenerate_code)
+            
+    def regenerate_code(self):
+        """Re-render the selected language with the current custom text"""
+        self._regen_job = None
+        selection = self.language_listbox.curselection()
+        if selection:
+            selected_item = sys.intern(self.language_listbox.get(selection[0]))
+            # Key releases that didn't change the text (arrows, shift, ...) need no re-render
+            if (self.custom_text.get(), selected_item) == self._last_render:
+                return
+            if selected_item in self.flat_languages:
                 self.generate_code_from_template(selected_item, self.flat_languages[selected_item])
             
-    def generate_code_from_template(self, language_name, lang_info):
-        """Generate code from a template and show compilation info if applicable"""
-        custom_text = self.custom_text.get() or "Hello World!"
-        # Escape special characters for string formatting
-        escaped_text = custom_text.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'")
+    def toggle_category(self, index, category):
+        """Expand or collapse a category header, inserting its members on demand"""
+        members = self.categories[category]
+        if category in self.expanded_categories:
+            self.expanded_categories.discard(category)
+            self.language_listbox.delete(index + 1, index + len(members))
+            header = f"▶ {category}"
+        else:
+            self.expanded_categories.add(category)
+            for offset, subkey in enumerate(members, 1):
+                self.language_listbox.insert(index + offset, f"  └─ {subkey}")
+            header = f"▼ {category}"
+        self.language_listbox.delete(index)
+        self.language_listbox.insert(index, header)
+        # Rewriting the header drops the selection; keep it (and keyboard focus) on the header
+        self.language_listbox.selection_set(index)
+        self.language_listbox.activate(index)
+        
+    def generate_code_from_template(self, language_name, entry):
+        """Generate code from a flat_languages entry and show compilation info if applicable"""
+        self._last_render = (self.custom_text.get(), language_name)
+        custom_text = self._last_render[0] or "Hello World!"
+        parts, compile_cmd, clean_name = entry
+        if clean_name in _MARKUP_LANGUAGES:
+            escaped_text = html.escape(custom_text, quote=True)
+        elif _LITERAL_SPECIALS.isdisjoint(custom_text):
+            escaped_text = custom_text  # Nothing to escape
+        else:
+            # Escape special characters for string literals
+            escaped_text = custom_text.translate(_ESCAPE_TABLE)
         
         try:
-            # Handle both old string format and new dict format
-            if isinstance(lang_info, str):
-                template = lang_info
-                compile_cmd = self.compilation_commands.get(language_name)
-            else:
-                template = lang_info.get("code", "")
-                compile_cmd = lang_info.get("compile") or self.compilation_commands.get(language_name)
-            
             # Generate the code
-            code = template.format(text=escaped_text)
-            self.code_text.delete(1.0, tk.END)
-            self.code_text.insert(1.0, code)
+            code = escaped_text.join(parts)
+            self.patch_text(self.code_text, code)
             
             # Show/hide compilation section based on whether we have compilation commands
             if compile_cmd:
-                self.compile_text.delete(1.0, tk.END)
-                self.compile_text.insert(1.0, compile_cmd)
-                self.compile_frame.pack(fill=tk.X, pady=(0, 10))
-            else:
-                self.compile_frame.pack_forget()
+                self.patch_text(self.compile_text, compile_cmd)
+            self.set_compile_visible(bool(compile_cmd))
             
-            # Clean up the display name for status
-            clean_name = language_name.replace("  └─ ", "")
             status_msg = f"Generated {clean_name} code"
-            if compile_cmd:
+            if language_name in self.compiled_languages:
                 status_msg += " (compiled language)"
             self.status_var.set(status_msg)
             
         except Exception as e:
             self.status_var.set(f"Error generating code: {str(e)}")
-            self.compile_frame.pack_forget()
+            self.set_compile_visible(False)
             
+    def set_compile_visible(self, visible):
+        """Show or hide the compilation section, re-packing only when that changes"""
+        if visible == self._compile_visible:
+            return
+        self._compile_visible = visible
+        if visible:
+            self.compile_frame.pack(fill=tk.X, pady=(0, 10))
+        else:
+            self.compile_frame.pack_forget()
+    
+    def patch_text(self, widget, new):
+        """Replace a Text widget's contents, rewriting only the span that differs"""
+        # Read back the widget rather than remembering the last render; the user may have edited it
+        old = widget.get("1.0", "end-1c")
+        if old == new:
+            return
+        # "+ N chars" offsets come from len(); Tk may count a character outside the BMP (emoji)
+        # as two, so such text is replaced whole
+        if not (old.isascii() and new.isascii()) and max(old + new) > "\uffff":
+            widget.delete("1.0", "end")
+            widget.insert("1.0", new)
+            return
+        prefix = len(os.path.commonprefix((old, new)))
+        suffix = len(os.path.commonprefix((old[prefix:][::-1], new[prefix:][::-1])))
+        widget.delete(f"1.0 + {prefix} chars", f"1.0 + {len(old) - suffix} chars")
+        widget.insert(f"1.0 + {prefix} chars", new[prefix:len(new) - suffix])
+    
     def generate_code(self, language):
         """Legacy method - kept for compatibility"""
-        if language in self.languages:
-            template = self.languages[language]
-            if isinstance(template, dict):
-                # This shouldn't happen with new structure, but handle gracefully
-                self.status_var.set("Please select a specific language variant")
-                return
-            self.generate_code_from_template(language, template)
+        if language in self.categories:
+            self.status_var.set("Please select a specific language variant")
+        elif language in self.flat_languages:
+            self.generate_code_from_template(language, self.flat_languages[language])
                 
     def copy_compile(self):
         """Copy compilation command to clipboard"""
@@ -1274,7 +724,8 @@ MSG:    .ASCII  /{text}/<15><12>
         """Clear the generated code area"""
         self.code_text.delete(1.0, tk.END)
         self.compile_text.delete(1.0, tk.END)
-        self.compile_frame.pack_forget()
+        self.set_compile_visible(False)
+        self._last_render = None
         self.status_var.set("Code cleared")
 
 def main():
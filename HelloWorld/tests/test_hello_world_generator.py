@@ -0,0 +1,159 @@
+"""Tests for the Hello World code generator"""
+
+import json
+import os
+import sys
+import tkinter as tk
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hello_world_generator import HelloWorldGenerator
+
+# Rendered code and compile command for every listbox entry of the original in-code table.
+# One deliberate difference: that dict literal listed "Fortran" twice, so a plain top-level
+# template replaced the Fortran standards category the README lists; the fixture keeps the
+# category's members (with their original templates and compile commands) instead
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_languages.json")
+
+
+def render(display_name, text="Hello World!"):
+    """Run generate_code_from_template against stand-in widgets and return what it shows"""
+    shown = {}
+    app = object.__new__(HelloWorldGenerator)
+    app.code_text, app.compile_text = "code", "compile"
+    app.custom_text = SimpleNamespace(get=lambda: text)
+    app.patch_text = lambda widget, content: shown.__setitem__(widget, content)
+    app.set_compile_visible = lambda visible: shown.__setitem__("compile_visible", visible)
+    app.status_var = SimpleNamespace(set=lambda status: shown.__setitem__("status", status))
+    app.generate_code_from_template(display_name, HelloWorldGenerator.flat_languages[display_name])
+    return shown
+
+
+class BaselineTableTest(unittest.TestCase):
+    def setUp(self):
+        with open(BASELINE_FILE, encoding="utf-8") as f:
+            self.baseline = json.load(f)
+
+    def test_same_entries(self):
+        self.assertEqual(set(HelloWorldGenerator.flat_languages), set(self.baseline))
+
+    def test_rendered_code_and_compile_command(self):
+        for display_name, expected in self.baseline.items():
+            with self.subTest(display_name):
+                shown = render(display_name)
+                self.assertEqual(shown["code"], expected["code"])
+                self.assertEqual(shown["compile_visible"], expected["compile"] is not None)
+                if expected["compile"] is not None:
+                    self.assertEqual(shown["compile"], expected["compile"])
+
+    def test_compiled_status_matches_compile_command(self):
+        for display_name, expected in self.baseline.items():
+            with self.subTest(display_name):
+                status = render(display_name)["status"]
+                self.assertEqual(status.endswith(" (compiled language)"), expected["compile"] is not None)
+
+    def test_fortran_is_a_category(self):
+        self.assertNotIn("Fortran", HelloWorldGenerator.flat_languages)
+        self.assertEqual(len(HelloWorldGenerator.categories["Fortran"]), 7)
+
+    def test_top_level_visual_basic_has_no_compile_command(self):
+        self.assertFalse(render("Visual Basic")["compile_visible"])
+        self.assertEqual(render("Visual Basic")["status"], "Generated Visual Basic code")
+        self.assertEqual(render("  └─ Visual Basic")["compile"], "vbc hello.vb && hello.exe")
+
+
+
+class FakeText:
+    """Records edits like a Text widget that counts characters as Python does"""
+
+    def __init__(self, content=""):
+        self.content = content
+        self.calls = []
+
+    def offset(self, index):
+        if index in ("end", "end-1c"):
+            return len(self.content)
+        return 0 if index == "1.0" else int(index.split()[2])
+
+    def get(self, start, end):
+        return self.content[self.offset(start):self.offset(end)]
+
+    def delete(self, start, end):
+        self.calls.append(("delete", start, end))
+        self.content = self.content[:self.offset(start)] + self.content[self.offset(end):]
+
+    def insert(self, index, text):
+        self.calls.append(("insert", index, text))
+        self.content = self.content[:self.offset(index)] + text + self.content[self.offset(index):]
+
+
+class PatchTextTest(unittest.TestCase):
+    def patch(self, old, new):
+        widget = FakeText(old)
+        object.__new__(HelloWorldGenerator).patch_text(widget, new)
+        self.assertEqual(widget.content, new)
+        return widget.calls
+
+    def test_bmp_text_rewrites_only_the_changed_span(self):
+        calls = self.patch('print("Hello")', 'print("Héllo")')
+        self.assertEqual(calls, [("delete", "1.0 + 8 chars", "1.0 + 9 chars"),
+                                 ("insert", "1.0 + 8 chars", "é")])
+
+    def test_non_bmp_template_is_replaced_whole(self):
+        parts = ('print("\U0001F680 ', '")')
+        calls = self.patch("Hi".join(parts), "Hello".join(parts))
+        self.assertEqual(calls, [("delete", "1.0", "end"), ("insert", "1.0", "Hello".join(parts))])
+
+    def test_non_bmp_old_text_is_replaced_whole(self):
+        calls = self.patch("\U0001F600 edited by hand", "plain")
+        self.assertEqual(calls, [("delete", "1.0", "end"), ("insert", "1.0", "plain")])
+
+
+class CategoryListTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("no display")
+        self.root.withdraw()
+        self.app = HelloWorldGenerator(self.root)
+        self.listbox = self.app.language_listbox
+        self.index = self.listbox.get(0, tk.END).index("▶ C")
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def select(self, index):
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.activate(index)
+        self.app.on_language_select(None)
+
+    def test_selecting_a_header_does_not_toggle_it(self):
+        before = self.listbox.get(0, tk.END)
+        self.select(self.index)
+        self.assertEqual(self.listbox.get(0, tk.END), before)
+
+    def test_patch_text_with_non_bmp_content(self):
+        parts = ('print("\U0001F680 ', '")')
+        text = self.app.code_text
+        for custom in ("Hi", "Hello", "Hel\U0001F600lo", "Hey"):
+            self.app.patch_text(text, custom.join(parts))
+            self.assertEqual(text.get("1.0", "end-1c"), custom.join(parts))
+
+    def test_activating_a_header_toggles_and_keeps_the_selection(self):
+        self.select(self.index)
+        self.app.on_header_activate(None)
+        self.assertEqual(self.listbox.get(self.index), "▼ C")
+        self.assertEqual(self.listbox.get(self.index + 1), "  └─ C (K&R)")
+        self.assertEqual(self.listbox.curselection(), (self.index,))
+        self.assertEqual(self.listbox.index(tk.ACTIVE), self.index)
+        self.app.on_header_activate(None)
+        self.assertEqual(self.listbox.get(self.index), "▶ C")
+        self.assertEqual(self.listbox.curselection(), (self.index,))
+
+
+if __name__ == "__main__":
+    unittest.main()
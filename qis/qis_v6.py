@@ -15,23 +15,54 @@ import time
 import os
 import sys
 import platform
+import random
+import re
+import shlex
+import shutil
+import signal
+import getpass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
 
 # Import SSH Q service
 from ssh_q_service import SSHQService, SSHConfigDialog
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
+
+# ANSI escape sequences: ESC + one byte in @.._ (except '['), or a CSI:
+# ESC [ params 0-? intermediates space-/ final @-~
+ANSI_ESCAPE_PATTERN = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+def strip_ansi_sequences(text):
+    """Remove ANSI escape sequences from text"""
+    # Most output has no escapes at all, and the containment test is cheaper than a regex scan
+    if '\x1b' not in text:
+        return text
+    return ANSI_ESCAPE_PATTERN.sub('', text)
+
+# PIL is only needed for the HAL image, so it is imported on first use by _import_pil()
+Image = ImageTk = None
+PIL_AVAILABLE = None  # Not checked yet
+
+def _import_pil():
+    """Import PIL on first call and return whether the HAL image can be displayed"""
+    global Image, ImageTk, PIL_AVAILABLE
+    if PIL_AVAILABLE is not None:
+        return PIL_AVAILABLE
     try:
-        from PIL import Image
-        # ImageTk not available, but Image is
-        PIL_AVAILABLE = False
-        print("Warning: PIL ImageTk not available. HAL image will not be displayed.")
+        from PIL import Image, ImageTk
+        PIL_AVAILABLE = True
     except ImportError:
-        # PIL not available at all
-        PIL_AVAILABLE = False
-        print("Warning: PIL not available. HAL image will not be displayed.")
+        try:
+            from PIL import Image
+            # ImageTk not available, but Image is
+            PIL_AVAILABLE = False
+            print("Warning: PIL ImageTk not available. HAL image will not be displayed.")
+        except ImportError:
+            # PIL not available at all
+            PIL_AVAILABLE = False
+            print("Warning: PIL not available. HAL image will not be displayed.")
+    return PIL_AVAILABLE
 
 class CrossPlatformEnvironmentDetector:
     """Cross-platform environment detector for Windows, Linux, and macOS"""
@@ -83,15 +114,11 @@ class CrossPlatformEnvironmentDetector:
         # Common Q CLI binary names
         q_names = ['q', 'q.exe'] if self.is_windows else ['q']
         
-        # Check PATH first
+        # Check PATH first, in-process (shutil.which does what which/where would, PATHEXT included)
         for q_name in q_names:
-            try:
-                result = subprocess.run(['which' if not self.is_windows else 'where', q_name], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0 and result.stdout.strip():
-                    return result.stdout.strip().split('\n')[0]
-            except:
-                pass
+            q_path = shutil.which(q_name)
+            if q_path:
+                return q_path
         
         # Platform-specific locations
         if self.is_windows:
@@ -167,6 +194,14 @@ class CrossPlatformEnvironmentDetector:
 class CrossPlatformQService:
     """Cross-platform Q service with local Q CLI and SSH routing support"""
     
+    # Result of the WSL Q CLI probe, reused across startups for a day
+    WSL_PROBE_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__", "wsl_q_probe.json")
+    WSL_PROBE_TTL = 24 * 60 * 60
+    
+    # Login shell (-l) loads the full WSL environment including PATH; -e runs bash directly
+    # instead of through the default shell, which would expand $(...) and backticks first
+    WSL_LOGIN_SHELL = ('wsl', '-e', 'bash', '-l', '-c')
+    
     def __init__(self):
         try:
             print("Initializing CrossPlatformQService...")
@@ -232,120 +267,6 @@ class CrossPlatformQService:
             else:
                 self.use_ssh = False
     
-    def _check_wsl_q_cli(self):
-        """Check if Q CLI is available in WSL environment"""
-        try:
-            # First check if WSL is available at all
-            import subprocess
-            try:
-                # Try subprocess.run first (Python 3.5+)
-                if hasattr(subprocess, 'run'):
-                    result = subprocess.run(['wsl', '--version'], 
-                                          capture_output=True, text=True, timeout=5)
-                    wsl_available = result.returncode == 0
-                else:
-                    # Fallback for older Python versions
-                    proc = subprocess.Popen(['wsl', '--version'], 
-                                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    stdout, stderr = proc.communicate()
-                    wsl_available = proc.returncode == 0
-                
-                if not wsl_available:
-                    return False
-                
-                # Method 1: Try with login shell (loads full environment)
-                if hasattr(subprocess, 'run'):
-                    result = subprocess.run(['wsl', 'bash', '-l', '-c', 'q --version'], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        return True
-                else:
-                    proc = subprocess.Popen(['wsl', 'bash', '-l', '-c', 'q --version'], 
-                                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    stdout, stderr = proc.communicate()
-                    if proc.returncode == 0:
-                        return True
-                
-                # Method 2: Try with login shell which command
-                if hasattr(subprocess, 'run'):
-                    result = subprocess.run(['wsl', 'bash', '-l', '-c', 'which q'], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0 and result.stdout.strip():
-                        q_path = result.stdout.strip()
-                        # Test if it works
-                        test_result = subprocess.run(['wsl', q_path, '--version'], 
-                                                   capture_output=True, text=True, timeout=10)
-                        if test_result.returncode == 0:
-                            return True
-                else:
-                    proc = subprocess.Popen(['wsl', 'bash', '-l', '-c', 'which q'], 
-                                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    stdout, stderr = proc.communicate()
-                    if proc.returncode == 0 and stdout.strip():
-                        q_path = stdout.strip()
-                        # Test if it works
-                        test_proc = subprocess.Popen(['wsl', q_path, '--version'], 
-                                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        test_stdout, test_stderr = test_proc.communicate()
-                        if test_proc.returncode == 0:
-                            return True
-                
-                # Method 3: Search common installation paths
-                # Get username first
-                username = "ubuntu"  # default
-                if hasattr(subprocess, 'run'):
-                    result = subprocess.run(['wsl', 'whoami'], 
-                                          capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        username = result.stdout.strip()
-                else:
-                    proc = subprocess.Popen(['wsl', 'whoami'], 
-                                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    stdout, stderr = proc.communicate()
-                    if proc.returncode == 0:
-                        username = stdout.strip()
-                
-                common_paths = [
-                    '/usr/local/bin/q',
-                    '/usr/bin/q',
-                    '/bin/q',
-                    '/home/' + username + '/.local/bin/q',
-                    '/home/' + username + '/bin/q',
-                    '/home/' + username + '/.cargo/bin/q',
-                    '/snap/bin/q'
-                ]
-                
-                for path in common_paths:
-                    if hasattr(subprocess, 'run'):
-                        result = subprocess.run(['wsl', 'test', '-f', path], 
-                                              capture_output=True, text=True, timeout=5)
-                        if result.returncode == 0:
-                            # Test if it works
-                            test_result = subprocess.run(['wsl', path, '--version'], 
-                                                       capture_output=True, text=True, timeout=10)
-                            if test_result.returncode == 0:
-                                return True
-                    else:
-                        proc = subprocess.Popen(['wsl', 'test', '-f', path], 
-                                              stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        stdout, stderr = proc.communicate()
-                        if proc.returncode == 0:
-                            # Test if it works
-                            test_proc = subprocess.Popen(['wsl', path, '--version'], 
-                                                       stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                            test_stdout, test_stderr = test_proc.communicate()
-                            if test_proc.returncode == 0:
-                                return True
-                
-                return False
-                
-            except OSError:
-                # WSL command not found (not on Windows or WSL not installed)
-                return False
-            
-        except Exception as e:
-            return False
-    
     def _get_wsl_username(self):
         """Get the current WSL username"""
         try:
@@ -431,19 +352,47 @@ class CrossPlatformQService:
         if not self.env_info['is_windows']:
             return False
         
+        # Each probe spawns wsl.exe (and may boot the WSL VM), so reuse a recent answer
+        # from the same Windows build (updates can add or remove WSL)
+        windows_build = platform.version()
         try:
-            # Check if WSL is available
-            result = subprocess.run(['wsl', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode != 0:
-                return False
-            
-            # Check if Q CLI exists in WSL
-            result = subprocess.run(['wsl', 'which', 'q'], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0 and result.stdout.strip()
+            if time.time() - os.path.getmtime(self.WSL_PROBE_CACHE) < self.WSL_PROBE_TTL:
+                with open(self.WSL_PROBE_CACHE, 'r') as f:
+                    cached = json.load(f)
+                if cached.get('windows_build') == windows_build:
+                    return bool(cached['available'])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass  # Missing or unreadable cache, probe again
+        
+        # Check that WSL is available and that Q CLI exists in it; both probes start together
+        # so the wait is the slower of the two instead of their sum
+        procs = []
+        try:
+            procs.append(subprocess.Popen(['wsl', '--version'],
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            procs.append(subprocess.Popen(['wsl', 'which', 'q'],
+                                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True))
+            deadline = time.monotonic() + 5
+            version_ok = procs[0].wait(timeout=5) == 0
+            which_output, _ = procs[1].communicate(timeout=max(0, deadline - time.monotonic()))
+            available = version_ok and procs[1].returncode == 0 and bool(which_output.strip())
         except:
-            return False
+            return False  # Don't cache failures to launch or timeouts
+        finally:
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+        if not available:
+            return False  # Only cache success, so installing Q CLI in WSL is picked up next launch
+        
+        try:
+            os.makedirs(os.path.dirname(self.WSL_PROBE_CACHE), exist_ok=True)
+            with open(self.WSL_PROBE_CACHE, 'w') as f:
+                json.dump({'available': True, 'windows_build': windows_build}, f)
+        except OSError:
+            pass  # Read-only install, probe again next time
+        return True
     
     def configure_ssh(self, parent_window=None):
         """Configure SSH Q service"""
@@ -509,19 +458,19 @@ class CrossPlatformQService:
                     
                     result = subprocess.run([q_path, 'chat', question], **subprocess_kwargs)
                     
-                    if result.returncode == 0 and result.stdout.strip():
+                    output = result.stdout.strip()
+                    if result.returncode == 0 and output:
                         # Strip ANSI escape codes from output
-                        clean_output = self._strip_ansi_codes(result.stdout.strip())
-                        return clean_output
+                        return self._strip_ansi_codes(output)
                     else:
                         # Try without auto-approval
                         subprocess_kwargs['input'] = None  # Remove input for second try
                         result = subprocess.run([q_path, 'chat', question], **subprocess_kwargs)
                         
-                        if result.returncode == 0 and result.stdout.strip():
+                        output = result.stdout.strip()
+                        if result.returncode == 0 and output:
                             # Strip ANSI escape codes from output
-                            clean_output = self._strip_ansi_codes(result.stdout.strip())
-                            return clean_output
+                            return self._strip_ansi_codes(output)
                         else:
                             raise Exception("Local Q CLI error: " + str(result.stderr or 'Unknown error'))
                 else:
@@ -543,44 +492,24 @@ class CrossPlatformQService:
                     proc = subprocess.Popen([q_path, 'chat', question], **popen_kwargs)
                     stdout_bytes, stderr_bytes = proc.communicate(input=b'y\n')
                     
-                    # Decode with UTF-8, replacing problematic characters
-                    try:
-                        stdout = stdout_bytes.decode('utf-8')
-                    except UnicodeDecodeError:
-                        stdout = stdout_bytes.decode('utf-8', errors='replace')
-                    
-                    try:
-                        stderr = stderr_bytes.decode('utf-8')
-                    except UnicodeDecodeError:
-                        stderr = stderr_bytes.decode('utf-8', errors='replace')
-                    
-                    if proc.returncode == 0 and stdout.strip():
+                    # Decode with UTF-8, replacing problematic characters; stderr is decoded only for errors
+                    output = stdout_bytes.decode('utf-8', errors='replace').strip()
+                    if proc.returncode == 0 and output:
                         # Strip ANSI escape codes from output
-                        clean_output = self._strip_ansi_codes(stdout.strip())
-                        return clean_output
+                        return self._strip_ansi_codes(output)
                     else:
                         # Try without auto-approval
                         popen_kwargs['stdin'] = None  # Remove stdin for second try
                         proc = subprocess.Popen([q_path, 'chat', question], **popen_kwargs)
                         stdout_bytes, stderr_bytes = proc.communicate()
                         
-                        # Decode with UTF-8, replacing problematic characters
-                        try:
-                            stdout = stdout_bytes.decode('utf-8')
-                        except UnicodeDecodeError:
-                            stdout = stdout_bytes.decode('utf-8', errors='replace')
-                        
-                        try:
-                            stderr = stderr_bytes.decode('utf-8')
-                        except UnicodeDecodeError:
-                            stderr = stderr_bytes.decode('utf-8', errors='replace')
-                        
-                        if proc.returncode == 0 and stdout.strip():
+                        # Decode with UTF-8, replacing problematic characters; stderr is decoded only for errors
+                        output = stdout_bytes.decode('utf-8', errors='replace').strip()
+                        if proc.returncode == 0 and output:
                             # Strip ANSI escape codes from output
-                            clean_output = self._strip_ansi_codes(stdout.strip())
-                            return clean_output
+                            return self._strip_ansi_codes(output)
                         else:
-                            raise Exception("Local Q CLI error: " + str(stderr or 'Unknown error'))
+                            raise Exception("Local Q CLI error: " + (stderr_bytes.decode('utf-8', errors='replace') or 'Unknown error'))
                         
             except Exception as e:
                 if "timed out" in str(e).lower():
@@ -590,19 +519,15 @@ class CrossPlatformQService:
     
     def _strip_ansi_codes(self, text):
         """Strip ANSI escape codes from text"""
-        import re
-        # Pattern to match ANSI escape sequences
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        return strip_ansi_sequences(text)
     
     def _query_wsl_q_cli(self, question, context=None):
         """Query Q CLI in WSL environment"""
         try:
-            # WSL-specific command execution with login shell
-            escaped_question = question.replace('"', '\\"')
-            
-            # Use login shell (-l) to load full environment including PATH
-            cmd = ['wsl', 'bash', '-l', '-c', 'echo "y" | q chat "' + escaped_question + '"']
+            # WSL-specific command execution with login shell. The question is single-quoted for
+            # bash so $, backticks and backslashes reach q verbatim, and the auto-approval "y" is
+            # fed on stdin (like the local path) instead of through an extra echo pipeline
+            cmd = [*self.WSL_LOGIN_SHELL, 'q chat ' + shlex.quote(question)]
             
             # Use appropriate subprocess method with proper encoding
             if hasattr(subprocess, 'run'):
@@ -623,21 +548,20 @@ class CrossPlatformQService:
                     subprocess_kwargs['startupinfo'] = startupinfo
                     subprocess_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
                 
-                result = subprocess.run(cmd, **subprocess_kwargs)
+                result = subprocess.run(cmd, input='y\n', **subprocess_kwargs)
                 
-                if result.returncode == 0 and result.stdout.strip():
+                output = result.stdout.strip()
+                if result.returncode == 0 and output:
                     # Strip ANSI escape codes from output
-                    clean_output = self._strip_ansi_codes(result.stdout.strip())
-                    return clean_output
+                    return self._strip_ansi_codes(output)
                 else:
                     # Try without auto-approval using login shell
-                    cmd = ['wsl', 'bash', '-l', '-c', 'q chat "' + escaped_question + '"']
                     result = subprocess.run(cmd, **subprocess_kwargs)
                     
-                    if result.returncode == 0 and result.stdout.strip():
+                    output = result.stdout.strip()
+                    if result.returncode == 0 and output:
                         # Strip ANSI escape codes from output
-                        clean_output = self._strip_ansi_codes(result.stdout.strip())
-                        return clean_output
+                        return self._strip_ansi_codes(output)
                     else:
                         raise Exception("WSL Q CLI error: " + str(result.stderr or 'Unknown error'))
             else:
@@ -655,47 +579,26 @@ class CrossPlatformQService:
                     popen_kwargs['startupinfo'] = startupinfo
                     popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
                 
-                proc = subprocess.Popen(cmd, **popen_kwargs)
-                stdout_bytes, stderr_bytes = proc.communicate()
+                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, **popen_kwargs)
+                stdout_bytes, stderr_bytes = proc.communicate(b'y\n')
                 
-                # Decode with UTF-8, replacing problematic characters
-                try:
-                    stdout = stdout_bytes.decode('utf-8')
-                except UnicodeDecodeError:
-                    stdout = stdout_bytes.decode('utf-8', errors='replace')
-                
-                try:
-                    stderr = stderr_bytes.decode('utf-8')
-                except UnicodeDecodeError:
-                    stderr = stderr_bytes.decode('utf-8', errors='replace')
-                
-                if proc.returncode == 0 and stdout.strip():
+                # Decode with UTF-8, replacing problematic characters; stderr is decoded only for errors
+                output = stdout_bytes.decode('utf-8', errors='replace').strip()
+                if proc.returncode == 0 and output:
                     # Strip ANSI escape codes from output
-                    clean_output = self._strip_ansi_codes(stdout.strip())
-                    return clean_output
+                    return self._strip_ansi_codes(output)
                 else:
                     # Try without auto-approval using login shell
-                    cmd = ['wsl', 'bash', '-l', '-c', 'q chat "' + escaped_question + '"']
                     proc = subprocess.Popen(cmd, **popen_kwargs)
                     stdout_bytes, stderr_bytes = proc.communicate()
                     
-                    # Decode with UTF-8, replacing problematic characters
-                    try:
-                        stdout = stdout_bytes.decode('utf-8')
-                    except UnicodeDecodeError:
-                        stdout = stdout_bytes.decode('utf-8', errors='replace')
-                    
-                    try:
-                        stderr = stderr_bytes.decode('utf-8')
-                    except UnicodeDecodeError:
-                        stderr = stderr_bytes.decode('utf-8', errors='replace')
-                    
-                    if proc.returncode == 0 and stdout.strip():
+                    # Decode with UTF-8, replacing problematic characters; stderr is decoded only for errors
+                    output = stdout_bytes.decode('utf-8', errors='replace').strip()
+                    if proc.returncode == 0 and output:
                         # Strip ANSI escape codes from output
-                        clean_output = self._strip_ansi_codes(stdout.strip())
-                        return clean_output
+                        return self._strip_ansi_codes(output)
                     else:
-                        raise Exception("WSL Q CLI error: " + str(stderr or 'Unknown error'))
+                        raise Exception("WSL Q CLI error: " + (stderr_bytes.decode('utf-8', errors='replace') or 'Unknown error'))
                     
         except Exception as e:
             if "timed out" in str(e).lower():
@@ -920,6 +823,70 @@ class QMethodConfigDialog:
 class HALWindowsInterface:
     """HAL 9000 Interface optimized for Windows with WSL support"""
     
+    # Input entry colors per mode, as (bg, fg, cursor) keys into get_theme_colors()
+    MODE_INPUT_COLORS = {
+        "Q": ('terminal_bg', 'terminal_fg', 'terminal_cursor'),
+        "SHELL": ('powershell_bg', 'powershell_fg', 'powershell_fg'),
+    }
+    
+    # The chat widget keeps the newest MAX_CHAT_MESSAGES messages (conversation_history keeps up to
+    # MAX_HISTORY_MESSAGES for SAVE LOG); older ones are dropped CHAT_TRIM_BATCH at a time
+    MAX_CHAT_MESSAGES = 500
+    CHAT_TRIM_BATCH = 50
+    MAX_HISTORY_MESSAGES = 10000
+    
+    # Delay before queued chat messages are written to the widget
+    CHAT_FLUSH_MS = 50
+    
+    # Minimum seconds between streamed shell output messages for a running command
+    SHELL_STREAM_INTERVAL = 0.25
+    
+    # Seconds a shell command may run (including background children holding its pipes)
+    SHELL_TIMEOUT = 30
+    
+    # Seconds to wait for a killed shell command's process and pipe readers before giving up on them
+    SHELL_KILL_GRACE = 2
+    
+    # Commands offered by tab completion when the word being completed isn't a path
+    COMPLETION_COMMANDS = {
+        "windows": ('dir', 'cd', 'type', 'copy', 'del', 'mkdir', 'rmdir'),
+        "wsl": ('ls', 'cd', 'cat', 'cp', 'rm', 'mkdir', 'rmdir', 'grep', 'find'),
+    }
+    
+    # Path completion candidates listed at most, in a grid this many characters wide
+    MAX_SHOWN_COMPLETIONS = 200
+    COMPLETION_GRID_WIDTH = 80
+    
+    # Lowercase q_error substrings meaning Q CLI itself is unavailable rather than failing
+    Q_UNAVAILABLE_MARKERS = ("unavailable", "not found")
+    
+    # Shell commands answered in-process on POSIX instead of forking a shell
+    POSIX_BUILTINS = frozenset({'pwd', 'whoami', 'date'})
+    
+    # Eye pulse colors for one 1s cycle at the 100ms animation tick (triangle wave 255 -> 128 -> 255)
+    EYE_PULSE_COLORS = tuple(f"#{int(128 + 127 * abs(frame / 5 - 1)):02x}0000" for frame in range(10))
+    
+    # Terminal font preferences per display mode, first installed family wins
+    TERMINAL_FONTS = {
+        "retro": (
+            'Perfect DOS VGA 437',  # Classic DOS font
+            'IBM Plex Mono',        # IBM-style monospace
+            'Source Code Pro',      # Modern but retro-friendly
+            'Consolas',            # Windows monospace
+            'Liberation Mono',      # Linux equivalent
+            'DejaVu Sans Mono',    # Cross-platform
+            'Courier New'          # Fallback
+        ),
+        "modern": (
+            'Segoe UI Mono',       # Windows 10/11 modern
+            'SF Mono',             # macOS
+            'Ubuntu Mono',         # Ubuntu
+            'Roboto Mono',         # Google
+            'Consolas',            # Windows fallback
+            'Courier New'          # Universal fallback
+        ),
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("QIS v6.0")
@@ -932,6 +899,14 @@ class HALWindowsInterface:
         # Store reference to this interface in the root window
         self.root.hal_interface = self
         
+        # Run the slow startup work (Q CLI/WSL subprocess probes, HAL image decode/resize) in
+        # parallel with skin loading; results are collected on the Tk thread before first use
+        self.hal_image_prepared = None
+        startup_pool = ThreadPoolExecutor(max_workers=2)
+        q_service_future = startup_pool.submit(CrossPlatformQService)
+        self.hal_image_future = startup_pool.submit(self.prepare_hal_image)
+        startup_pool.shutdown(wait=False)
+        
         # Initialize skin manager
         self.skin_manager = None
         try:
@@ -950,19 +925,57 @@ class HALWindowsInterface:
         # Queue for thread communication
         self.output_queue = queue.Queue()
         
+        # Q queries and status probes each run in order on one long-lived daemon worker, so
+        # none of their subprocess/SSH calls block the Tk thread. Shell commands get a thread
+        # each so a slow or hung command can't hold up the ones typed after it. A job that
+        # raises is reported with its worker's error message instead of ending the worker
+        self.q_jobs = queue.Queue()
+        self.probe_jobs = queue.Queue()
+        workers = (
+            (self.q_jobs, lambda e: ('q_error', f'Q Service Error: {str(e)}')),
+            (self.probe_jobs, lambda e: ('system_status', "System Status: ERROR (" + str(e)[:50] + ")", '#FF0000')),
+        )
+        for jobs, error_message in workers:
+            threading.Thread(target=self.command_worker, args=(jobs, error_message), daemon=True).start()
+        
         # HAL's current state
         self.hal_active = True
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=self.MAX_HISTORY_MESSAGES)  # Oldest evicted first
         self.current_mode = "Q"  # "Q" for Q CLI, "SHELL" for commands
         
+        # Chat segments waiting to be written by the next idle flush
+        self.pending_chat = []
+        self.chat_flush_scheduled = False
+        
+        # Text widget line count of each message shown in the chat, oldest first
+        self.chat_message_lines = deque()
+        
+        # Last formatted HH:MM:SS and the second it was formatted for
+        self.timestamp_second = None
+        self.timestamp_text = ""
+        self.shown_time = None  # Text currently in the clock label
+        
+        # Installed font families (read once) and font tuples keyed by (mode, size, weight)
+        self.font_families = None
+        self.font_cache = {}
+        
+        # Theme color tables keyed by (color_theme, display_mode)
+        self.theme_colors_cache = {}
+        
+        # Tab completion directory listings keyed by path, as (mtime_ns, entries)
+        self.completion_cache = {}
+        
+        # Result of the 'wsl echo test' probe, checked on first need
+        self.wsl_echo_ok = None
+        
         # Windows-specific working directory handling
         if platform.system().lower() == 'windows':
             self.shell_cwd = os.path.expanduser("~")
         else:
             self.shell_cwd = os.path.expanduser("~")
         
-        # Initialize cross-platform Q service
-        self.q_service = CrossPlatformQService()
+        # Cross-platform Q service, constructed by the startup pool
+        self.q_service = q_service_future.result()
         
         # Shell name will be determined dynamically
         self.shell_name = "SHELL"  # Default fallback
@@ -1029,10 +1042,10 @@ class HALWindowsInterface:
         if hasattr(self, 'retro_btn'):
             self.retro_btn.config(text=retro_text)
     
-    def load_hal_image(self):
-        """Load the HAL 9000 panel image if available"""
-        if not PIL_AVAILABLE:
-            self.hal_image = None
+    def prepare_hal_image(self):
+        """Decode and resize the HAL panel image (no Tk calls, safe off the main thread)"""
+        self.hal_image_prepared = None
+        if not _import_pil():
             return
             
         image_path = os.path.join(os.path.dirname(__file__), "assets", "Hal_9000_Panel.svg.png")
@@ -1068,18 +1081,51 @@ class HALWindowsInterface:
                     target_width = target_width_by_height
                     target_height = target_height_by_height
                 
-                # Resize the image
-                pil_image = pil_image.resize((target_width, target_height), Image.Resampling.LANCZOS)
-                self.hal_image = ImageTk.PhotoImage(pil_image)
-                
-                # Store dimensions for layout purposes
-                self.hal_image_width = target_width
-                self.hal_image_height = target_height
+                # Reuse the resized copy cached by an earlier run; LANCZOS on the full panel is slow
+                cache_path = os.path.join(os.path.dirname(__file__), "__pycache__",
+                                          f"Hal_9000_Panel_{target_width}x{target_height}.png")
+                if (os.path.exists(cache_path)
+                        and os.path.getmtime(cache_path) >= os.path.getmtime(image_path)):
+                    pil_image = Image.open(cache_path)
+                    pil_image.load()  # Decode here rather than lazily on the Tk thread
+                else:
+                    # Resize the image
+                    pil_image = pil_image.resize((target_width, target_height), Image.Resampling.LANCZOS)
+                    try:
+                        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                        pil_image.save(cache_path)
+                    except OSError:
+                        pass  # Read-only install, resize again next time
                 
-                print("HAL image loaded: {}x{} (aspect ratio: {:.3f})".format(
-                    target_width, target_height, aspect_ratio))
-            else:
-                self.hal_image = None
+                self.hal_image_prepared = (pil_image, target_width, target_height, aspect_ratio)
+        except Exception as e:
+            print("Could not load HAL image: {}".format(e))
+    
+    def load_hal_image(self):
+        """Load the HAL 9000 panel image if available"""
+        # Use the background decode started in __init__, otherwise decode now
+        if self.hal_image_future is not None:
+            self.hal_image_future.result()
+            self.hal_image_future = None
+        else:
+            self.prepare_hal_image()
+        
+        prepared, self.hal_image_prepared = self.hal_image_prepared, None
+        if prepared is None:
+            self.hal_image = None
+            return
+        
+        pil_image, target_width, target_height, aspect_ratio = prepared
+        try:
+            # PhotoImage must be created on the Tk thread
+            self.hal_image = ImageTk.PhotoImage(pil_image)
+            
+            # Store dimensions for layout purposes
+            self.hal_image_width = target_width
+            self.hal_image_height = target_height
+            
+            print("HAL image loaded: {}x{} (aspect ratio: {:.3f})".format(
+                target_width, target_height, aspect_ratio))
         except Exception as e:
             print("Could not load HAL image: {}".format(e))
             self.hal_image = None
@@ -1168,8 +1214,9 @@ class HALWindowsInterface:
                 else:
                     print("DEBUG: No colors available from skin")
                 
-                # Force interface refresh
-                self.root.update()
+                # Redraw now without re-entering the event loop (update() would also run
+                # pending user events and timers in the middle of the skin change)
+                self.root.update_idletasks()
                 print(f"DEBUG: Applied skin: {personality_name}")
                 
         except Exception as e:
@@ -1376,8 +1423,31 @@ class HALWindowsInterface:
             messagebox.showerror("SSH Configuration Error", 
                                f"Error configuring SSH:\n{str(e)}")
     
+    def wsl_responds(self):
+        """Check whether WSL can run a command, remembering a positive answer for the session"""
+        if self.wsl_echo_ok is None:
+            # Skip spawning (and waiting up to 3s on) wsl.exe when it isn't installed at all
+            if not shutil.which('wsl'):
+                self.wsl_echo_ok = False
+                return False
+            try:
+                # Quick WSL availability check; a failure is retried on the next status update
+                result = subprocess.run(['wsl', 'echo', 'test'], 
+                                      capture_output=True, text=True, timeout=3)
+                if result.returncode == 0:
+                    self.wsl_echo_ok = True
+            except:
+                pass
+        return bool(self.wsl_echo_ok)
+    
     def update_system_status(self):
         """Update system status based on Q service availability and environment"""
+        # get_status() may test SSH or spawn wsl.exe, so probe on the worker and let
+        # check_output_queue apply the result
+        self.probe_jobs.put((self.probe_system_status, ()))
+    
+    def probe_system_status(self):
+        """Work out the system status text and color (no Tk calls, runs on the probe worker)"""
         try:
             status_info = self.q_service.get_status()
             env_info = status_info.get('environment', {})
@@ -1390,14 +1460,7 @@ class HALWindowsInterface:
             if q_method == 'wsl' and not q_available:
                 # Try a more lenient check - if WSL method is selected, assume it works
                 # unless we can definitively prove it doesn't
-                try:
-                    # Quick WSL availability check
-                    result = subprocess.run(['wsl', 'echo', 'test'], 
-                                          capture_output=True, text=True, timeout=3)
-                    if result.returncode == 0:
-                        q_available = True  # WSL is working, assume Q CLI is too
-                except:
-                    pass
+                q_available = self.wsl_responds()  # WSL is working, assume Q CLI is too
             
             if q_available:
                 if q_method == 'ssh' or 'SSH Remote' in status_info.get('method', ''):
@@ -1424,7 +1487,7 @@ class HALWindowsInterface:
                     status_text = "System Status: OPERATIONAL (macOS)"
                 else:
                     status_text = "System Status: OPERATIONAL (Linux)"
-                self.status_label.config(foreground='#00FF00')  # Green
+                status_color = '#00FF00'  # Green
             else:
                 if env_info.get('is_wsl', False):
                     wsl_distro = env_info.get('wsl_distro', 'WSL')
@@ -1437,14 +1500,14 @@ class HALWindowsInterface:
                     status_text = "System Status: LIMITED (macOS, Q CLI unavailable)"
                 else:
                     status_text = "System Status: LIMITED (Linux, Q CLI unavailable)"
-                self.status_label.config(foreground='#FF8800')  # Orange
-            
-            self.status_label.config(text=status_text)
+                status_color = '#FF8800'  # Orange
             
         except Exception as e:
             # For debugging - show what the actual error is
-            error_msg = "System Status: ERROR (" + str(e)[:50] + ")"
-            self.status_label.config(text=error_msg, foreground='#FF0000')  # Red
+            status_text = "System Status: ERROR (" + str(e)[:50] + ")"
+            status_color = '#FF0000'  # Red
+        
+        self.output_queue.put(('system_status', status_text, status_color))
     
     def update_connection_status(self):
         """Update connection status based on current mode and Q service availability"""
@@ -1601,9 +1664,10 @@ class HALWindowsInterface:
         self.eye_canvas = tk.Canvas(parent, width=200, height=200, bg='#000000', highlightthickness=0)
         self.eye_canvas.pack(expand=True)
         
-        # Draw HAL's eye
+        # Draw HAL's eye; the inner circle is created once and only recolored while animating
         self.eye_canvas.create_oval(50, 50, 150, 150, outline='#FF0000', width=3)
-        self.eye_canvas.create_oval(75, 75, 125, 125, fill='#FF0000', outline='#FF0000')
+        self.eye_inner = self.eye_canvas.create_oval(75, 75, 125, 125, fill='#FF0000', outline='#FF0000', tags="eye_inner")
+        self.eye_color = '#FF0000'
         
         # Animate the eye
         self.animate_eye()
@@ -1611,13 +1675,12 @@ class HALWindowsInterface:
     def animate_eye(self):
         """Animate HAL's eye"""
         if hasattr(self, 'eye_canvas'):
-            # Simple pulsing animation
-            current_time = time.time()
-            intensity = int(128 + 127 * abs(((current_time * 2) % 2) - 1))
-            color = f"#{intensity:02x}0000"
+            # Simple pulsing animation, one precomputed color per 100ms slot of the cycle
+            color = self.EYE_PULSE_COLORS[int(time.time() * 10) % 10]
             
-            self.eye_canvas.delete("eye_inner")
-            self.eye_canvas.create_oval(75, 75, 125, 125, fill=color, outline=color, tags="eye_inner")
+            if color != self.eye_color:
+                self.eye_canvas.itemconfig(self.eye_inner, fill=color, outline=color)
+                self.eye_color = color
             
             self.root.after(100, self.animate_eye)
     
@@ -1755,50 +1818,29 @@ class HALWindowsInterface:
     
     def get_terminal_font(self, size=12, weight='normal'):
         """Get terminal-style font based on display mode"""
-        if self.display_mode == "retro":
-            # Try authentic retro fonts in order of preference
-            retro_fonts = [
-                'Perfect DOS VGA 437',  # Classic DOS font
-                'IBM Plex Mono',        # IBM-style monospace
-                'Source Code Pro',      # Modern but retro-friendly
-                'Consolas',            # Windows monospace
-                'Liberation Mono',      # Linux equivalent
-                'DejaVu Sans Mono',    # Cross-platform
-                'Courier New'          # Fallback
-            ]
-            
-            # Test which fonts are available
-            import tkinter.font as tkFont
-            available_fonts = tkFont.families()
-            
-            for font in retro_fonts:
-                if font in available_fonts:
-                    return (font, size, weight)
-            
-            # Fallback to Courier New with retro styling
-            return ('Courier New', size, weight)
-        else:
-            # Modern clean fonts
-            modern_fonts = [
-                'Segoe UI Mono',       # Windows 10/11 modern
-                'SF Mono',             # macOS
-                'Ubuntu Mono',         # Ubuntu
-                'Roboto Mono',         # Google
-                'Consolas',            # Windows fallback
-                'Courier New'          # Universal fallback
-            ]
-            
-            import tkinter.font as tkFont
-            available_fonts = tkFont.families()
-            
-            for font in modern_fonts:
-                if font in available_fonts:
-                    return (font, size, weight)
-            
-            return ('Courier New', size, weight)
+        key = (self.display_mode, size, weight)
+        font = self.font_cache.get(key)
+        if font is None:
+            if self.font_families is None:
+                import tkinter.font as tkFont
+                self.font_families = frozenset(tkFont.families())
+            
+            preferences = self.TERMINAL_FONTS["retro" if self.display_mode == "retro" else "modern"]
+            name = next((f for f in preferences if f in self.font_families), 'Courier New')
+            font = self.font_cache[key] = (name, size, weight)
+        return font
     
     def get_theme_colors(self):
         """Get colors for current theme and display mode"""
+        # Built once per (theme, display mode); read-only since every caller shares it
+        key = (self.color_theme, self.display_mode)
+        colors = self.theme_colors_cache.get(key)
+        if colors is None:
+            colors = self.theme_colors_cache[key] = MappingProxyType(self.build_theme_colors())
+        return colors
+    
+    def build_theme_colors(self):
+        """Build the color table for the current theme and display mode"""
         base_colors = {}
         
         if self.color_theme == "amber":
@@ -1857,7 +1899,9 @@ class HALWindowsInterface:
     def setup_styles(self):
         """Configure the retro HAL-inspired styling"""
         style = ttk.Style()
-        style.theme_use('clam')
+        # Switching themes restyles every ttk widget, so only do it the first time
+        if style.theme_use() != 'clam':
+            style.theme_use('clam')
         
         colors = self.get_theme_colors()
         
@@ -1920,31 +1964,29 @@ class HALWindowsInterface:
             selectbackground=colors['terminal_select']
         )
         
-        # Update input field based on current mode
-        if self.current_mode == "Q":
-            self.input_entry.config(
-                bg=colors['terminal_bg'],
-                fg=colors['terminal_fg'],
-                insertbackground=colors['terminal_cursor'],
-                selectbackground=colors['terminal_select']
-            )
-        else:  # POWERSHELL mode
-            self.input_entry.config(
-                bg=colors['powershell_bg'],
-                fg=colors['powershell_fg'],
-                insertbackground=colors['powershell_fg'],
-                selectbackground=colors['terminal_select']
-            )
+        # Update input field based on current mode (SHELL colors for any non-Q mode)
+        bg_key, fg_key, cursor_key = self.MODE_INPUT_COLORS.get(self.current_mode, self.MODE_INPUT_COLORS["SHELL"])
+        self.input_entry.config(
+            bg=colors[bg_key],
+            fg=colors[fg_key],
+            insertbackground=colors[cursor_key],
+            selectbackground=colors['terminal_select']
+        )
         
-        # Update text tags
+        # Update text tags as (tag, foreground, font)
         terminal_font = self.get_terminal_font(11)
-        self.chat_display.tag_configure('hal', foreground='#FF0000', font=self.get_terminal_font(11, 'bold'))
-        self.chat_display.tag_configure('user', foreground=colors['terminal_fg'], font=terminal_font)
-        self.chat_display.tag_configure('powershell_user', foreground=colors['powershell_fg'], font=terminal_font)
-        self.chat_display.tag_configure('powershell_output', foreground=colors['output_fg'], font=self.get_terminal_font(10))
-        self.chat_display.tag_configure('powershell_error', foreground=colors['error_fg'], font=self.get_terminal_font(10))
-        self.chat_display.tag_configure('system', foreground=colors['system_fg'], font=self.get_terminal_font(10, 'italic'))
-        self.chat_display.tag_configure('timestamp', foreground='#888888', font=self.get_terminal_font(9))
+        small_font = self.get_terminal_font(10)
+        text_tags = (
+            ('hal', '#FF0000', self.get_terminal_font(11, 'bold')),
+            ('user', colors['terminal_fg'], terminal_font),
+            ('powershell_user', colors['powershell_fg'], terminal_font),
+            ('powershell_output', colors['output_fg'], small_font),
+            ('powershell_error', colors['error_fg'], small_font),
+            ('system', colors['system_fg'], self.get_terminal_font(10, 'italic')),
+            ('timestamp', '#888888', self.get_terminal_font(9)),
+        )
+        for tag, foreground, tag_font in text_tags:
+            self.chat_display.tag_configure(tag, foreground=foreground, font=tag_font)
         
         # Update theme button text
         theme_text = "AMBER" if self.color_theme == "green" else "GREEN"
@@ -2045,6 +2087,14 @@ class HALWindowsInterface:
                     width=1
                 )
             
+            # Flicker line, created once hidden and only moved/shown by animate_scan_lines
+            self.flicker_line = self.retro_canvas.create_line(
+                0, 0, chat_width, 0,
+                fill='#ffffff',
+                width=1,
+                state='hidden'
+            )
+            
             # Make canvas transparent to clicks
             self.retro_canvas.bind('<Button-1>', lambda e: self.chat_display.focus_set())
             
@@ -2060,59 +2110,50 @@ class HALWindowsInterface:
     def animate_scan_lines(self):
         """Animate scan lines for authentic CRT effect"""
         if self.retro_canvas and self.scan_lines_enabled:
-            # Subtle flicker effect
-            current_time = time.time()
-            flicker_intensity = 0.95 + 0.05 * abs(((current_time * 10) % 2) - 1)
-            
-            # Randomly flicker some scan lines
-            import random
+            # Randomly flicker a scan line by moving and showing the existing flicker item
             if random.random() < 0.1:  # 10% chance per frame
                 y_pos = random.randint(0, self.retro_canvas.winfo_height())
-                self.retro_canvas.create_line(
-                    0, y_pos, self.retro_canvas.winfo_width(), y_pos,
-                    fill='#ffffff',
-                    width=1,
-                    tags='flicker'
-                )
-                # Remove flicker line after short time
-                self.root.after(50, lambda: self.retro_canvas.delete('flicker'))
+                self.retro_canvas.coords(self.flicker_line, 0, y_pos, self.retro_canvas.winfo_width(), y_pos)
+                self.retro_canvas.itemconfigure(self.flicker_line, state='normal')
+                # Hide flicker line after short time
+                self.root.after(50, self.hide_flicker_line)
             
             # Continue animation
             self.root.after(100, self.animate_scan_lines)
     
+    def hide_flicker_line(self):
+        """Hide the scan line flicker (the overlay may have been removed meanwhile)"""
+        if self.retro_canvas:
+            self.retro_canvas.itemconfigure(self.flicker_line, state='hidden')
+    
     def set_mode(self, mode):
         """Switch between Q CLI and Shell modes"""
+        if mode == self.current_mode:
+            return  # Already in this mode, nothing to restyle
         self.current_mode = mode
         colors = self.get_theme_colors()
         
         if mode == "Q":
-            self.mode_label.config(text="Mode: Q CLI")
-            self.q_mode_btn.config(style='HAL.Active.TButton')
-            self.shell_mode_btn.config(style='HAL.TButton')
-            self.input_entry.config(
-                bg=colors['terminal_bg'], 
-                fg=colors['terminal_fg'],
-                insertbackground=colors['terminal_cursor']
-            )
-            self.input_label.config(text="Q INPUT:")
+            mode_name = "Q CLI"
+            mode_text, input_text = "Mode: Q CLI", "Q INPUT:"
+            active_btn, inactive_btn = self.q_mode_btn, self.shell_mode_btn
         else:  # SHELL
             shell_name = self.get_shell_display_name()
-            self.mode_label.config(text=f"Mode: {shell_name} ({self.shell_cwd})")
-            self.shell_mode_btn.config(style='HAL.Active.TButton')
-            self.q_mode_btn.config(style='HAL.TButton')
-            self.input_entry.config(
-                bg=colors['powershell_bg'], 
-                fg=colors['powershell_fg'],
-                insertbackground=colors['powershell_fg']
-            )
-            shell_name_lower = shell_name.lower()
-            self.input_label.config(text=f"{shell_name} INPUT:")
+            mode_name = f"{shell_name} Command"
+            mode_text, input_text = f"Mode: {shell_name} ({self.shell_cwd})", f"{shell_name} INPUT:"
+            active_btn, inactive_btn = self.shell_mode_btn, self.q_mode_btn
+        
+        bg_key, fg_key, cursor_key = self.MODE_INPUT_COLORS[mode]
+        self.mode_label.config(text=mode_text)
+        active_btn.config(style='HAL.Active.TButton')
+        inactive_btn.config(style='HAL.TButton')
+        self.input_entry.config(bg=colors[bg_key], fg=colors[fg_key], insertbackground=colors[cursor_key])
+        self.input_label.config(text=input_text)
         
         # Update connection status when mode changes
         self.update_connection_status()
         
         # Add mode switch message
-        mode_name = "Q CLI" if mode == "Q" else f"{self.get_shell_display_name()} Command"
         self.add_message("SYSTEM", f"Switched to {mode_name} mode", "system")
     
     def handle_tab_completion(self, event):
@@ -2123,8 +2164,8 @@ class HALWindowsInterface:
         current_text = self.input_entry.get()
         cursor_pos = self.input_entry.index(tk.INSERT)
         
-        # Get the word being completed
-        words = current_text[:cursor_pos].split()
+        # Get the word being completed (only the last word is split off)
+        words = current_text[:cursor_pos].rsplit(None, 1)
         if not words:
             return "break"
         
@@ -2149,11 +2190,12 @@ class HALWindowsInterface:
                 
                 if os.path.exists(base_path):
                     matches = []
-                    for item in os.listdir(base_path):
-                        if item.lower().startswith(prefix.lower()):
-                            full_path = os.path.join(base_path, item)
-                            if os.path.isdir(full_path):
-                                matches.append(item + ('\\' if not self.q_service.env_info['is_wsl'] else '/'))
+                    prefix_lower = prefix.lower()
+                    dir_suffix = '\\' if not self.q_service.env_info['is_wsl'] else '/'
+                    for item, item_lower, is_dir in self.completion_entries(base_path):
+                        if item_lower.startswith(prefix_lower):
+                            if is_dir:
+                                matches.append(item + dir_suffix)
                             else:
                                 matches.append(item)
                     
@@ -2166,11 +2208,12 @@ class HALWindowsInterface:
                             self.input_entry.insert(0, new_text)
                         else:
                             # Multiple matches - show them
-                            self.add_message("SYSTEM", f"Matches: {', '.join(matches[:10])}", "system")
+                            self.add_message("SYSTEM", "Matches:\n" + self.format_completions(matches), "system")
             else:
                 # Command completion (basic)
-                common_commands = ['dir', 'cd', 'type', 'copy', 'del', 'mkdir', 'rmdir'] if not self.q_service.env_info['is_wsl'] else ['ls', 'cd', 'cat', 'cp', 'rm', 'mkdir', 'rmdir', 'grep', 'find']
-                matches = [cmd for cmd in common_commands if cmd.startswith(partial_word.lower())]
+                common_commands = self.COMPLETION_COMMANDS["wsl" if self.q_service.env_info['is_wsl'] else "windows"]
+                partial_lower = partial_word.lower()
+                matches = [cmd for cmd in common_commands if cmd.startswith(partial_lower)]
                 
                 if matches:
                     if len(matches) == 1:
@@ -2186,9 +2229,43 @@ class HALWindowsInterface:
         
         return "break"
     
+    def format_completions(self, matches):
+        """Lay out completion candidates in columns (like ls) as one chat message"""
+        shown = sorted(matches, key=str.lower)[:self.MAX_SHOWN_COMPLETIONS]
+        col_width = max(map(len, shown)) + 2
+        columns = max(1, self.COMPLETION_GRID_WIDTH // col_width)
+        rows = -(-len(shown) // columns)
+        grid = "\n".join("".join(name.ljust(col_width) for name in shown[row::rows]).rstrip()
+                         for row in range(rows))
+        if len(matches) > len(shown):
+            grid += f"\n... and {len(matches) - len(shown)} more"
+        return grid
+    
+    def completion_entries(self, base_path):
+        """(name, lowercased name, is_dir) for each entry of base_path, rescanned only when it changes"""
+        mtime = os.stat(base_path).st_mtime_ns
+        cached = self.completion_cache.get(base_path)
+        if cached is None or cached[0] != mtime:
+            # One directory scan; DirEntry.is_dir() reuses the listing's file type
+            # instead of stat()ing every candidate
+            with os.scandir(base_path) as entries:
+                listing = tuple((entry.name, entry.name.lower(), entry.is_dir()) for entry in entries)
+            if len(self.completion_cache) >= 32:
+                self.completion_cache.clear()
+            cached = self.completion_cache[base_path] = (mtime, listing)
+        return cached[1]
+    
+    def get_timestamp(self):
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        if now != self.timestamp_second:
+            self.timestamp_second = now
+            self.timestamp_text = time.strftime("%H:%M:%S", time.localtime(now))
+        return self.timestamp_text
+    
     def add_message(self, sender, message, tag="user"):
         """Add message to chat display"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self.get_timestamp()
         
         # Store in conversation history
         self.conversation_history.append({
@@ -2198,24 +2275,44 @@ class HALWindowsInterface:
             'mode': self.current_mode
         })
         
-        self.chat_display.config(state=tk.NORMAL)
-        
-        # Add timestamp
-        self.chat_display.insert(tk.END, f"[{timestamp}] ", "timestamp")
+        # Queue timestamp, sender and message as (text, tag) pairs for the display
+        self.pending_chat += (f"[{timestamp}] ", "timestamp",
+                              f"{sender}: ", "hal" if sender == "HAL" else tag,
+                              f"{message}\n\n", tag)
+        self.chat_message_lines.append(message.count('\n') + 2)
+        
+        # Bursts of messages (including several output_queue drains) are written together
+        if not self.chat_flush_scheduled:
+            self.chat_flush_scheduled = True
+            self.root.after(self.CHAT_FLUSH_MS, self.flush_chat)
+    
+    def flush_chat(self):
+        """Write all pending chat messages to the display in a single insert"""
+        self.chat_flush_scheduled = False
+        if not self.pending_chat:
+            return
         
-        # Add sender and message
-        if sender == "HAL":
-            self.chat_display.insert(tk.END, f"{sender}: ", "hal")
-        else:
-            self.chat_display.insert(tk.END, f"{sender}: ", tag)
+        # Only follow new output if the user hasn't scrolled back to read earlier messages
+        at_bottom = self.chat_display.yview()[1] >= 0.999
+        self.chat_display.config(state=tk.NORMAL)
+        self.chat_display.insert(tk.END, *self.pending_chat)
         
-        self.chat_display.insert(tk.END, f"{message}\n\n", tag)
+        # Keep Text layout and scrolling cost bounded in long sessions by dropping the oldest messages
+        if len(self.chat_message_lines) > self.MAX_CHAT_MESSAGES + self.CHAT_TRIM_BATCH:
+            dropped_lines = 0
+            while len(self.chat_message_lines) > self.MAX_CHAT_MESSAGES:
+                dropped_lines += self.chat_message_lines.popleft()
+            self.chat_display.delete('1.0', f'{dropped_lines + 1}.0')
         
         self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        if at_bottom:
+            self.chat_display.see(tk.END)
+        self.pending_chat.clear()
     
     def clear_chat(self):
         """Clear chat display and conversation history"""
+        self.pending_chat.clear()
+        self.chat_message_lines.clear()
         self.chat_display.config(state=tk.NORMAL)
         self.chat_display.delete(1.0, tk.END)
         self.chat_display.config(state=tk.DISABLED)
@@ -2308,8 +2405,8 @@ My mission is to provide you with accurate information and help you accomplish y
         # Update status
         self.connection_status.config(text="Q CLI: PROCESSING...")
         
-        # Send to Q CLI in background thread
-        threading.Thread(target=self.process_q_command, args=(message,), daemon=True).start()
+        # Send to Q CLI on the background worker
+        self.q_jobs.put((self.process_q_command, (message,)))
     
     def send_shell_command(self, command):
         """Execute shell command (cross-platform)"""
@@ -2331,6 +2428,15 @@ My mission is to provide you with accurate information and help you accomplish y
         # Execute in background thread
         threading.Thread(target=self.process_shell_command, args=(command,), daemon=True).start()
     
+    def command_worker(self, jobs, error_message):
+        """Run queued (handler, args) jobs one at a time; handlers report via output_queue"""
+        while True:
+            handler, args = jobs.get()
+            try:
+                handler(*args)
+            except Exception as e:
+                self.output_queue.put(error_message(e))
+    
     def process_q_command(self, message):
         """Process the command through Windows Q service"""
         try:
@@ -2356,9 +2462,11 @@ My mission is to provide you with accurate information and help you accomplish y
         try:
             env_info = self.q_service.env_info
             
-            # Handle cd command specially to track working directory
-            if command.strip().lower().startswith('cd '):
-                path = command[3:].strip()
+            # Handle cd command specially to track working directory; only the first word is case-folded
+            command_line = command.strip()
+            head, sep, rest = command_line.partition(' ')
+            if sep and head.lower() == 'cd':
+                path = rest.strip()
                 if not path:
                     path = os.path.expanduser("~")
                 
@@ -2378,94 +2486,174 @@ My mission is to provide you with accurate information and help you accomplish y
                     self.output_queue.put(('shell_error', f"cd: {str(e)}"))
                 return
             
-            # Execute other commands with cross-platform handling
-            if env_info['is_wsl']:
-                # WSL execution with proper encoding
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    cwd=self.shell_cwd,
-                    encoding='utf-8',
-                    errors='replace'
-                )
-            elif env_info['is_windows']:
-                # Windows native execution with proper encoding
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    cwd=self.shell_cwd,
-                    encoding='utf-8',
-                    errors='replace'
-                )
+            # pwd, whoami and date are answered in-process on POSIX instead of forking a shell
+            builtin = command_line
+            if builtin in self.POSIX_BUILTINS and not env_info['is_windows']:
+                if builtin == 'pwd':
+                    output = self.shell_cwd
+                elif builtin == 'whoami':
+                    output = getpass.getuser()
+                else:
+                    output = time.strftime("%a %b %e %H:%M:%S %Z %Y")
+                self.output_queue.put(('shell_output', output))
+                return
+            
+            # Execute other commands through the shell (same call on WSL, Windows and Linux/macOS).
+            # stdout is streamed so long-running commands show output as it arrives; both pipes
+            # are read on helper threads so neither can fill up and stall the command.
+            # The shell gets its own process group so a timeout can kill everything it started
+            if env_info['is_windows']:
+                group_kwargs = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
             else:
-                # Linux/macOS execution
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    cwd=self.shell_cwd,
-                    encoding='utf-8',
-                    errors='replace'
-                )
+                group_kwargs = {'start_new_session': True}
+            proc = subprocess.Popen(
+                command,
+                shell=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=self.shell_cwd,
+                encoding='utf-8',
+                errors='replace',
+                **group_kwargs
+            )
+            stdout_lines = queue.Queue()  # Lines as read, then None at EOF
+            stderr_parts = []
+            
+            def pump_stdout():
+                for line in proc.stdout:
+                    stdout_lines.put(line)
+                stdout_lines.put(None)
+            
+            readers = [threading.Thread(target=pump_stdout, daemon=True),
+                       threading.Thread(target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True)]
+            for reader in readers:
+                reader.start()
             
-            # Send output
-            if result.stdout:
-                self.output_queue.put(('shell_output', result.stdout.strip()))
+            # The time limit is enforced by this method's own waits rather than a Timer thread
+            kill_at = time.monotonic() + self.SHELL_TIMEOUT
+            timed_out = False
+            give_up_at = None  # Set on kill; readers still blocked past it are abandoned
+            
+            try:
+                # Lines are batched into one message per SHELL_STREAM_INTERVAL, so a quick command
+                # still produces a single OUTPUT block
+                pending = []
+                deadline = None
+                finished = False
+                while not finished:
+                    wake_times = [t for t in (deadline, give_up_at if timed_out else kill_at) if t is not None]
+                    wait = max(0, min(wake_times) - time.monotonic())
+                    try:
+                        line = stdout_lines.get(timeout=wait)
+                    except queue.Empty:
+                        line = ''  # Batch interval, time limit or kill grace elapsed
+                    now = time.monotonic()
+                    if not timed_out and now >= kill_at:
+                        timed_out = True
+                        give_up_at = now + self.SHELL_KILL_GRACE
+                        self.kill_process_tree(proc)
+                    if line is None or (timed_out and now >= give_up_at):
+                        finished = True
+                    elif line:
+                        pending.append(line)
+                        if deadline is None:
+                            deadline = now + self.SHELL_STREAM_INTERVAL
+                    if pending and (finished or now >= deadline):
+                        self.output_queue.put(('shell_output', ''.join(pending).strip()))
+                        pending.clear()
+                        deadline = None
+                
+                def wait_until(limit):
+                    """Wait for the process and both readers until limit; True if all finished"""
+                    try:
+                        proc.wait(timeout=max(0, limit - time.monotonic()))
+                    except subprocess.TimeoutExpired:
+                        return False
+                    for reader in readers:
+                        reader.join(timeout=max(0, limit - time.monotonic()))
+                    return not any(reader.is_alive() for reader in readers)
+                
+                # stdout can reach EOF while the command (or a background child holding stderr)
+                # keeps running, so the time limit still applies; after a kill, the grace period
+                # bounds the wait since a process that left the group can hold the pipes open
+                if not timed_out and not wait_until(kill_at):
+                    timed_out = True
+                    give_up_at = time.monotonic() + self.SHELL_KILL_GRACE
+                    self.kill_process_tree(proc)
+                if timed_out:
+                    wait_until(give_up_at)
+                returncode = proc.poll()
+            finally:
+                # Closing a pipe blocks while its reader is mid-read, so abandoned readers
+                # (daemon threads) keep theirs until the last writer exits
+                if not any(reader.is_alive() for reader in readers):
+                    proc.stdout.close()
+                    proc.stderr.close()
+            
+            if timed_out:
+                self.output_queue.put(('shell_error', 'Command timed out'))
+                return
             
-            if result.stderr:
-                self.output_queue.put(('shell_error', result.stderr.strip()))
+            stderr = ''.join(stderr_parts)
+            if stderr:
+                self.output_queue.put(('shell_error', stderr.strip()))
             
-            if result.returncode != 0 and not result.stderr:
-                self.output_queue.put(('shell_error', f"Command exited with code {result.returncode}"))
+            if returncode != 0 and not stderr:
+                self.output_queue.put(('shell_error', f"Command exited with code {returncode}"))
                 
-        except subprocess.TimeoutExpired:
-            self.output_queue.put(('shell_error', 'Command timed out'))
         except Exception as e:
             self.output_queue.put(('shell_error', f'Error: {str(e)}'))
     
+    def kill_process_tree(self, proc):
+        """Kill a shell command together with every process it started"""
+        try:
+            if self.q_service.env_info['is_windows']:
+                subprocess.run(['taskkill', '/F', '/T', '/PID', str(proc.pid)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+            else:
+                os.killpg(proc.pid, signal.SIGKILL)  # pgid == pid (start_new_session)
+        except (OSError, subprocess.SubprocessError):
+            pass  # Already gone or taskkill unavailable; fall back to the shell itself
+        if proc.poll() is None:
+            proc.kill()
+    
     def check_output_queue(self):
         """Check for messages from background threads"""
+        # Drain everything queued since the last tick; the status label is updated once at the
+        # end (last message wins) instead of after every message
+        status_text = None
+        refresh_status = False
+        drained = False
         try:
             while True:
                 msg_type, message, *extra = self.output_queue.get_nowait()
+                drained = True
                 
                 if msg_type == 'q_success':
                     self.add_message("HAL", message, "hal")
-                    self.connection_status.config(text="Q CLI: READY")
+                    status_text, refresh_status = "Q CLI: READY", False
                 elif msg_type == 'q_error':
                     self.add_message("SYSTEM", message, "system")
                     # Check if it's a Q CLI unavailable error
-                    if "unavailable" in message.lower() or "not found" in message.lower():
-                        self.connection_status.config(text="Q CLI: UNAVAILABLE")
+                    lowered = message.lower()
+                    if any(marker in lowered for marker in self.Q_UNAVAILABLE_MARKERS):
+                        status_text = "Q CLI: UNAVAILABLE"
                     else:
-                        self.connection_status.config(text="Q CLI: ERROR")
-                elif msg_type == 'shell_success':
-                    self.add_message("SYSTEM", message, "system")
-                    self.update_connection_status()
-                elif msg_type == 'shell_output':
-                    self.add_message("OUTPUT", message, "powershell_output")
-                    self.update_connection_status()
-                elif msg_type == 'shell_error':
-                    self.add_message("ERROR", message, "powershell_error")
-                    self.update_connection_status()
-                # Keep old powershell_* for backward compatibility
-                elif msg_type == 'powershell_success':
+                        status_text = "Q CLI: ERROR"
+                    refresh_status = False
+                # Old powershell_* types are kept for backward compatibility
+                elif msg_type in ('shell_success', 'powershell_success'):
                     self.add_message("SYSTEM", message, "system")
-                    self.update_connection_status()
-                elif msg_type == 'powershell_output':
+                    status_text, refresh_status = None, True
+                elif msg_type in ('shell_output', 'powershell_output'):
                     self.add_message("OUTPUT", message, "powershell_output")
-                    self.update_connection_status()
-                elif msg_type == 'powershell_error':
+                    status_text, refresh_status = None, True
+                elif msg_type in ('shell_error', 'powershell_error'):
                     self.add_message("ERROR", message, "powershell_error")
-                    self.update_connection_status()
+                    status_text, refresh_status = None, True
+                elif msg_type == 'system_status':
+                    self.status_label.config(text=message, foreground=extra[0])
                 elif msg_type == 'update_mode_label':
                     if self.current_mode == "SHELL":
                         shell_name = self.get_shell_display_name()
@@ -2476,14 +2664,24 @@ My mission is to provide you with accurate information and help you accomplish y
         except queue.Empty:
             pass
         
-        # Schedule next check
-        self.root.after(100, self.check_output_queue)
+        if refresh_status:
+            self.update_connection_status()
+        elif status_text:
+            self.connection_status.config(text=status_text)
+        
+        # Schedule next check; poll faster while output is arriving
+        self.root.after(20 if drained else 100, self.check_output_queue)
     
     def update_time(self):
         """Update time display"""
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self.update_time)
+        current_time = self.get_timestamp()
+        if current_time != self.shown_time:
+            self.time_label.config(text=current_time)
+            self.shown_time = current_time
+        
+        # Wake just after the next wall-clock second so the display never skips a second
+        delay = 1000 - int(time.time() % 1 * 1000) + 5
+        self.root.after(delay, self.update_time)
     
     def save_log(self):
         """Save conversation log to file"""
@@ -2695,18 +2893,22 @@ def main():
     """Main function to start the Windows HAL interface"""
     root = tk.Tk()
     
-    # Check PIL availability and show warning if needed
-    if not PIL_AVAILABLE:
-        messagebox.showwarning("Missing Dependency", 
-                             "PIL (Pillow) or ImageTk not fully available.\n"
-                             "HAL image will not be displayed.\n\n"
-                             "To fix this:\n"
-                             "• Windows: pip install Pillow\n"
-                             "• Or install via conda/anaconda\n\n"
-                             "HAL interface will work with animated eye fallback.")
-    
+    # PIL is imported off the Tk thread while the window is built (prepare_hal_image)
     app = HALWindowsInterface(root)
     
+    def warn_if_pil_missing():
+        """Show the missing PIL warning once the window is up"""
+        if not _import_pil():
+            messagebox.showwarning("Missing Dependency", 
+                                 "PIL (Pillow) or ImageTk not fully available.\n"
+                                 "HAL image will not be displayed.\n\n"
+                                 "To fix this:\n"
+                                 "• Windows: pip install Pillow\n"
+                                 "• Or install via conda/anaconda\n\n"
+                                 "HAL interface will work with animated eye fallback.")
+    
+    root.after_idle(warn_if_pil_missing)
+    
     # Handle window closing
     root.protocol("WM_DELETE_WINDOW", app.on_window_close)
     
@@ -0,0 +1,152 @@
+"""Tests for the QIS v6 Q CLI service"""
+
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qis_v6
+
+QUESTION = 'what does $(rm -rf ~) and `id` do with "quotes", \'apostrophes\' and \\n?'
+
+
+class WSLQueryTest(unittest.TestCase):
+    def make_service(self):
+        service = object.__new__(qis_v6.CrossPlatformQService)
+        service.env_info = {'is_windows': False}
+        return service
+
+    def query(self):
+        result = SimpleNamespace(returncode=0, stdout='answer\n', stderr='')
+        with mock.patch.object(qis_v6.subprocess, 'run', return_value=result) as run:
+            self.assertEqual(self.make_service()._query_wsl_q_cli(QUESTION), 'answer')
+        return run
+
+    def test_exact_argv(self):
+        run = self.query()
+        cmd = run.call_args.args[0]
+        self.assertEqual(cmd[:5], ['wsl', '-e', 'bash', '-l', '-c'])
+        self.assertEqual(cmd[5:], ["q chat 'what does $(rm -rf ~) and `id` do with \"quotes\", "
+                                   "'\"'\"'apostrophes'\"'\"' and \\n?'"])
+        self.assertEqual(run.call_args.kwargs['input'], 'y\n')
+
+    @unittest.skipUnless(shutil.which('bash'), "bash not installed")
+    def test_question_reaches_q_verbatim(self):
+        # Run the bash -c script against a stand-in q that echoes its arguments
+        with tempfile.TemporaryDirectory() as bin_dir:
+            fake_q = os.path.join(bin_dir, 'q')
+            with open(fake_q, 'w') as f:
+                f.write('#!/bin/sh\nprintf "%s" "$2"\n')
+            os.chmod(fake_q, 0o755)
+            script = self.query().call_args.args[0][-1]
+            env = dict(os.environ, PATH=bin_dir + os.pathsep + os.environ.get('PATH', ''))
+            output = subprocess.run(['bash', '-c', script], capture_output=True, text=True, env=env)
+        self.assertEqual(output.stdout, QUESTION)
+
+
+class WSLProbeCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.service = object.__new__(qis_v6.CrossPlatformQService)
+        self.service.env_info = {'is_windows': True}
+        self.service.WSL_PROBE_CACHE = os.path.join(self.tmp.name, 'wsl_q_probe.json')
+
+    def probe(self, which_output):
+        def popen(cmd, **kwargs):
+            proc = mock.Mock(returncode=0)
+            proc.wait.return_value = 0
+            proc.communicate.return_value = (which_output, '')
+            return proc
+        with mock.patch.object(qis_v6.subprocess, 'Popen', side_effect=popen) as launched:
+            available = self.service._check_wsl_q_available()
+        return available, launched.call_count
+
+    def test_success_is_cached(self):
+        self.assertEqual(self.probe('/usr/bin/q\n'), (True, 2))
+        self.assertEqual(self.probe(''), (True, 0))
+
+    def test_failure_is_not_cached(self):
+        self.assertEqual(self.probe(''), (False, 2))
+        self.assertFalse(os.path.exists(self.service.WSL_PROBE_CACHE))
+        self.assertEqual(self.probe('/usr/bin/q\n'), (True, 2))
+
+
+@unittest.skipUnless(os.name == 'posix', "uses POSIX shell commands")
+class ShellCommandTest(unittest.TestCase):
+    def run_command(self, command):
+        # A bare instance with only what process_shell_command uses; short limits keep timeouts quick
+        window = object.__new__(qis_v6.HALWindowsInterface)
+        window.SHELL_TIMEOUT = 1
+        window.SHELL_KILL_GRACE = 0.5
+        window.q_service = SimpleNamespace(env_info={'is_windows': False, 'is_wsl': False})
+        window.shell_cwd = tempfile.gettempdir()
+        window.output_queue = queue.Queue()
+        start = time.monotonic()
+        window.process_shell_command(command)
+        elapsed = time.monotonic() - start
+        messages = []
+        while not window.output_queue.empty():
+            messages.append(window.output_queue.get_nowait())
+        return messages, elapsed
+
+    def assertTimedOut(self, messages, elapsed):
+        self.assertEqual(messages[-1], ('shell_error', 'Command timed out'))
+        self.assertLess(elapsed, 1 + 0.5 + 1)
+
+    def test_quick_output_is_one_message(self):
+        messages, _ = self.run_command('echo one; echo two; echo three')
+        self.assertEqual(messages, [('shell_output', 'one\ntwo\nthree')])
+
+    def test_slow_output_is_streamed(self):
+        messages, _ = self.run_command('echo one; sleep 0.4; echo two')
+        self.assertEqual(messages, [('shell_output', 'one'), ('shell_output', 'two')])
+
+    def test_stderr_is_reported(self):
+        messages, _ = self.run_command('echo out; echo oops >&2; exit 1')
+        self.assertEqual(messages, [('shell_output', 'out'), ('shell_error', 'oops')])
+
+    def test_exit_code_is_reported(self):
+        messages, _ = self.run_command('exit 3')
+        self.assertEqual(messages, [('shell_error', 'Command exited with code 3')])
+
+    def test_grandchild_holding_stdout_is_killed(self):
+        messages, elapsed = self.run_command('echo start; sleep 15; echo end')
+        self.assertEqual(messages[0], ('shell_output', 'start'))
+        self.assertTimedOut(messages, elapsed)
+
+    def test_limit_applies_after_stdout_eof(self):
+        messages, elapsed = self.run_command('exec sleep 15 > /dev/null')
+        self.assertEqual(messages, [('shell_error', 'Command timed out')])
+        self.assertTimedOut(messages, elapsed)
+
+    def test_background_child_holding_stderr_is_killed(self):
+        messages, elapsed = self.run_command('sleep 15 > /dev/null & echo started')
+        self.assertEqual(messages[0], ('shell_output', 'started'))
+        self.assertTimedOut(messages, elapsed)
+
+
+class CommandWorkerTest(unittest.TestCase):
+    def test_failing_job_is_reported_and_worker_continues(self):
+        window = object.__new__(qis_v6.HALWindowsInterface)
+        window.output_queue = queue.Queue()
+        jobs = queue.Queue()
+        threading.Thread(target=window.command_worker, daemon=True,
+                         args=(jobs, lambda e: ('q_error', str(e)))).start()
+        jobs.put((int, ('not a number',)))
+        jobs.put((window.output_queue.put, (('q_success', 'done'),)))
+        self.assertEqual(window.output_queue.get(timeout=5)[0], 'q_error')
+        self.assertEqual(window.output_queue.get(timeout=5), ('q_success', 'done'))
+
+
+if __name__ == '__main__':
+    unittest.main()
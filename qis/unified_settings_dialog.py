@@ -264,7 +264,8 @@ class UnifiedSettingsDialog:
                         bg='#000000')
         title.pack(pady=20)
         
-        # Current status display
+        # Current status display; queried once for the whole tab since it may probe SSH and WSL
+        status = None
         if self.q_service:
             try:
                 status = self.q_service.get_q_method_status()
@@ -297,8 +298,7 @@ class UnifiedSettingsDialog:
         # Get available methods from Q service if possible
         if self.q_service:
             try:
-                status = self.q_service.get_q_method_status()
-                methods_info = status.get('methods', {})
+                methods_info = status['methods']
                 methods = []
                 for method_key, method_data in methods_info.items():
                     if method_key != 'auto':  # Skip auto in the detailed list